@@ -1,9 +1,11 @@
 import os
+import sys
 
 INPUT_FILE = "input.bin"
 OUTPUT_DIR = "output_splits"
 PAGE_SIZE = 2112  # 2KB 데이터 + 64바이트 스페어 영역
 ALL_FF_PAGE = b'\xff' * PAGE_SIZE
+LOG_FLUSH_LINES = 1000  # 페이지별 로그를 모아서 한 번에 출력할 줄 수
 
 def split_by_pages():
     """
@@ -20,6 +22,10 @@ def split_by_pages():
 
     print(f"'{INPUT_FILE}' 파일을 {PAGE_SIZE}바이트 페이지 단위로 분할을 시작합니다...")
 
+    # 페이지마다 print하지 않고 모아 두었다가 한 번의 write로 출력
+    log_lines = []
+    # 출력 경로 앞부분은 한 번만 만들고 페이지마다 os.path.join을 호출하지 않음
+    output_prefix = os.path.join(OUTPUT_DIR, '')
     try:
         with open(INPUT_FILE, 'rb') as f:
             page_number = 0
@@ -35,27 +41,36 @@ def split_by_pages():
                 # 마지막 페이지가 PAGE_SIZE보다 작을 경우 0x00으로 패딩
                 if len(page_data) < PAGE_SIZE:
                     page_data += b'\x00' * (PAGE_SIZE - len(page_data))
-                    print(f"  - 마지막 페이지를 {PAGE_SIZE}바이트로 패딩했습니다.")
+                    log_lines.append(f"  - 마지막 페이지를 {PAGE_SIZE}바이트로 패딩했습니다.")
                 
                 # 0xFF로만 채워진 페이지인지 확인
                 is_ff_page = (page_data == ALL_FF_PAGE)
                 
                 if not is_ff_page:
                     # 유의미한 데이터가 있는 페이지만 저장
-                    output_filename = os.path.join(OUTPUT_DIR, f"{current_address:08X}.bin")
+                    output_filename = f"{output_prefix}{current_address:08X}.bin"
                     
                     with open(output_filename, 'wb') as out_f:
                         out_f.write(page_data)
                     
-                    print(f"  - 페이지 {page_number:04d} 저장: {output_filename} ({len(page_data)} 바이트)")
+                    log_lines.append(f"  - 페이지 {page_number:04d} 저장: {output_filename} ({len(page_data)} 바이트)")
                     saved_pages += 1
                 else:
-                    print(f"  - 페이지 {page_number:04d} 건너뜀: 주소 {current_address:08X} (0xFF로 가득참)")
+                    log_lines.append(f"  - 페이지 {page_number:04d} 건너뜀: 주소 {current_address:08X} (0xFF로 가득참)")
+
+                if len(log_lines) >= LOG_FLUSH_LINES:
+                    sys.stdout.write('\n'.join(log_lines) + '\n')
+                    log_lines.clear()
                 
                 page_number += 1
                 current_address += PAGE_SIZE
 
+            if log_lines:
+                sys.stdout.write('\n'.join(log_lines) + '\n')
+
     except Exception as e:
+        if log_lines:
+            sys.stdout.write('\n'.join(log_lines) + '\n')
         print(f"파일 처리 중 오류 발생: {e}")
         return
 
@@ -68,11 +83,12 @@ def get_file_info():
     """
     입력 파일의 정보를 표시합니다.
     """
-    if not os.path.exists(INPUT_FILE):
+    # 존재 확인과 크기 조회를 stat 한 번으로 처리
+    try:
+        file_size = os.stat(INPUT_FILE).st_size
+    except FileNotFoundError:
         print(f"오류: 입력 파일 '{INPUT_FILE}'을(를) 찾을 수 없습니다.")
         return
-    
-    file_size = os.path.getsize(INPUT_FILE)
     total_pages = (file_size + PAGE_SIZE - 1) // PAGE_SIZE  # 올림 계산
     
     print(f"파일 정보:")
@@ -1,10 +1,12 @@
 import os
+import sys
 
 INPUT_DIR = "output_splits"
 OUTPUT_FILE = "merged_output.bin"
 ORIGINAL_FILE = "input.bin"
 ROW_SIZE = 16
 ALL_FF_ROW = b'\xff' * ROW_SIZE
+LOG_FLUSH_LINES = 1000  # 파일별 로그를 모아서 한 번에 출력할 줄 수
 
 def merge_files():
     """
@@ -16,16 +18,18 @@ def merge_files():
         print(f"오류: 입력 디렉토리 '{INPUT_DIR}'을(를) 찾을 수 없습니다.")
         return
     
-    if not os.path.exists(ORIGINAL_FILE):
+    # 존재 확인과 크기 조회를 stat 한 번으로 처리
+    try:
+        original_size = os.stat(ORIGINAL_FILE).st_size
+    except FileNotFoundError:
         print(f"오류: 원본 파일 '{ORIGINAL_FILE}'을(를) 찾을 수 없습니다.")
         return
 
-    original_size = os.path.getsize(ORIGINAL_FILE)
-
-    chunk_files = sorted(
-        [f for f in os.listdir(INPUT_DIR) if f.endswith('.bin')],
-        key=lambda f: int(f.split('.')[0], 16)
-    )
+    # 디렉토리를 scandir로 한 번만 훑고, 파일명(시작 주소)은 한 번만 해석하여 (주소, 파일명, 경로)로 정렬
+    with os.scandir(INPUT_DIR) as it:
+        chunk_files = sorted(
+            (int(e.name[:-4], 16), e.name, e.path) for e in it if e.name.endswith('.bin')
+        )
 
     if not chunk_files:
         print(f"'{INPUT_DIR}' 디렉토리에 분할된 파일이 없습니다.")
@@ -34,28 +38,36 @@ def merge_files():
     print(f"'{OUTPUT_FILE}' 파일 생성을 시작합니다...")
 
     current_address = 0
+    # 파일마다 print하지 않고 모아 두었다가 한 번의 write로 출력
+    log_lines = []
     try:
         with open(OUTPUT_FILE, 'wb') as out_f:
-            for filename in chunk_files:
-                chunk_start_address = int(filename.split('.')[0], 16)
+            for chunk_start_address, filename, file_path in chunk_files:
 
                 # 주소에 맞게 0xFF 채우기
                 if chunk_start_address > current_address:
                     padding_size = chunk_start_address - current_address
-                    print(f"  - {current_address:08X}부터 {padding_size} 바이트 0xFF 채우기")
+                    log_lines.append(f"  - {current_address:08X}부터 {padding_size} 바이트 0xFF 채우기")
                     padding_rows = padding_size // ROW_SIZE
                     for _ in range(padding_rows):
                         out_f.write(ALL_FF_ROW)
                 
                 # 청크 데이터 쓰기
-                file_path = os.path.join(INPUT_DIR, filename)
                 with open(file_path, 'rb') as in_f:
                     data = in_f.read()
                     out_f.write(data)
-                    print(f"  - {filename} 데이터 쓰기 ({len(data)} 바이트)")
+                    log_lines.append(f"  - {filename} 데이터 쓰기 ({len(data)} 바이트)")
                 
                 current_address = chunk_start_address + len(data)
 
+                if len(log_lines) >= LOG_FLUSH_LINES:
+                    sys.stdout.write('\n'.join(log_lines) + '\n')
+                    log_lines.clear()
+
+            if log_lines:
+                sys.stdout.write('\n'.join(log_lines) + '\n')
+                log_lines.clear()
+
             # 원본 파일 크기에 맞게 마지막 부분을 0xFF로 채우기
             if current_address < original_size:
                 final_padding_size = original_size - current_address
@@ -69,6 +81,8 @@ def merge_files():
                     out_f.write(b'\xff' * remaining_bytes)
 
     except Exception as e:
+        if log_lines:
+            sys.stdout.write('\n'.join(log_lines) + '\n')
         print(f"파일 병합 중 오류 발생: {e}")
         return
 
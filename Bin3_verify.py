@@ -6,18 +6,18 @@ MERGED_FILE = "merged_output.bin"
 
 def get_file_info(file_path):
     """파일의 크기와 SHA-256 해시를 반환합니다."""
-    if not os.path.exists(file_path):
-        print(f"오류: 파일 '{file_path}'을(를) 찾을 수 없습니다.")
-        return None, None
-
     try:
         hasher = hashlib.sha256()
         with open(file_path, 'rb') as f:
+            # 이미 연 파일의 fstat으로 크기를 얻어 경로 stat을 따로 하지 않음
+            file_size = os.fstat(f.fileno()).st_size
             while chunk := f.read(8192):
                 hasher.update(chunk)
         file_hash = hasher.hexdigest()
-        file_size = os.path.getsize(file_path)
         return file_size, file_hash
+    except FileNotFoundError:
+        print(f"오류: 파일 '{file_path}'을(를) 찾을 수 없습니다.")
+        return None, None
     except Exception as e:
         print(f"'{file_path}' 파일 정보 읽기 중 오류 발생: {e}")
         return None, None
@@ -48,10 +48,14 @@ def are_files_identical(file1_path, file2_path, chunk_size=8192):
                     break
                 
                 if chunk1 != chunk2:
-                    for i in range(len(chunk1)):
-                        if chunk1[i] != chunk2[i]:
-                            print(f"파일 내용이 {position + i} 바이트 위치에서 다릅니다.")
-                            return False
+                    # 64바이트 조각을 슬라이스 비교(C 수준)로 먼저 찾고, 다른 조각 안에서만 바이트 단위로 확인
+                    for base in range(0, len(chunk1), 64):
+                        if chunk1[base:base + 64] == chunk2[base:base + 64]:
+                            continue
+                        for i in range(base, min(base + 64, len(chunk1))):
+                            if chunk1[i] != chunk2[i]:
+                                print(f"파일 내용이 {position + i} 바이트 위치에서 다릅니다.")
+                                return False
                     print("파일 내용이 다릅니다.")
                     return False
                 
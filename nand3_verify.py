@@ -22,17 +22,18 @@ def verify_nand_sequential(input_filepath: str):
     output_filepath = "output.bin"
     pickle_filepath = "nand_data.pkl"
     MAX_RETRIES = 5  # 최대 재시도 횟수
-    RETRY_DELAY = 1    # 재시도 간 대기 시간 (초)
+    RETRY_DELAY = 0.001  # 첫 재시도 전 대기 시간 (초), 재시도마다 2배 (1, 2, 4, 8ms ...)
+    PROGRESS_INTERVAL = 0.25  # 진행률 표시 갱신 간격 (초)
     
     try:
         print("NAND 드라이버 초기화 중 (공장 Bad Block 스캔)...")
         nand = MT29F4G08ADADA()
         
         # 1. 입력 파일 유효성 검사
-        if not os.path.exists(input_filepath):
+        try:
+            expected_size = os.stat(input_filepath).st_size  # 존재 확인과 크기 조회를 stat 한 번으로
+        except FileNotFoundError:
             raise FileNotFoundError(f"입력 파일 없음: {input_filepath}")
-        
-        expected_size = os.path.getsize(input_filepath)
         total_blocks_to_process = nand.TOTAL_BLOCKS
         
         # 2. 기존 파일들 삭제
@@ -44,32 +45,37 @@ def verify_nand_sequential(input_filepath: str):
         print(f"\n파일 '{input_filepath}'와 NAND 칩의 첫 {total_blocks_to_process}개 블록을 비교합니다.")
         print("경고: Bad Block으로 표시된 블록도 강제로 읽기를 시도합니다.")
         start_time = datetime.now()
+        # 블록마다 datetime 객체를 만들지 않고 단조 시계의 float 초로 진행 시간을 계산
+        start_clock = time.monotonic()
+        next_progress_time = start_clock
         
         # 3. 블록 단위로 NAND 읽기 -> 실시간 pickle 저장
         for block in range(total_blocks_to_process):
-            # 진행률 및 예상 완료 시간 계산
-            current_time = datetime.now()
-            elapsed_time = current_time - start_time
-            progress = (block + 1) / total_blocks_to_process
+            # 진행률 및 예상 완료 시간 계산 (PROGRESS_INTERVAL초마다 한 번만 표시)
+            now = time.monotonic()
+            if now >= next_progress_time or block == total_blocks_to_process - 1:
+                next_progress_time = now + PROGRESS_INTERVAL
+                elapsed_time = now - start_clock
+                progress = (block + 1) / total_blocks_to_process
             
-            if progress > 0:
-                estimated_total_time = elapsed_time / progress
-                remaining_time = estimated_total_time - elapsed_time
+                if progress > 0:
+                    estimated_total_time = elapsed_time / progress
+                    remaining_time = estimated_total_time - elapsed_time
                 
-                # 남은 시간을 시:분:초 형태로 변환
-                remaining_seconds = int(remaining_time.total_seconds())
-                hours, remainder = divmod(remaining_seconds, 3600)
-                minutes, seconds = divmod(remainder, 60)
+                    # 남은 시간을 시:분:초 형태로 변환
+                    remaining_seconds = int(remaining_time)
+                    hours, remainder = divmod(remaining_seconds, 3600)
+                    minutes, seconds = divmod(remainder, 60)
                 
-                if hours > 0:
-                    time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                else:
-                    time_str = f"{minutes:02d}:{seconds:02d}"
+                    if hours > 0:
+                        time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+                    else:
+                        time_str = f"{minutes:02d}:{seconds:02d}"
                 
-                sys.stdout.write(f"\r블록 처리 중: {block + 1}/{total_blocks_to_process} ({progress*100:.1f}%) - 남은 시간: {time_str}")
-            else:
-                sys.stdout.write(f"\r블록 처리 중: {block + 1}/{total_blocks_to_process}")
-            sys.stdout.flush()
+                    sys.stdout.write(f"\r블록 처리 중: {block + 1}/{total_blocks_to_process} ({progress*100:.1f}%) - 남은 시간: {time_str}")
+                else:
+                    sys.stdout.write(f"\r블록 처리 중: {block + 1}/{total_blocks_to_process}")
+                sys.stdout.flush()
 
             # [수정] Bad Block 건너뛰기 로직 삭제
             if nand.is_bad_block(block):
@@ -92,8 +98,9 @@ def verify_nand_sequential(input_filepath: str):
                         read_success = True
                         break # 성공 시 재시도 루프 탈출
                     except Exception as e:
-                        print(f"\n경고: 페이지 {page_no} 읽기 실패 (시도 {attempt + 1}/{MAX_RETRIES}). {RETRY_DELAY}초 후 재시도... 오류: {e}")
-                        time.sleep(RETRY_DELAY)
+                        delay = RETRY_DELAY * (2 ** attempt)
+                        print(f"\n경고: 페이지 {page_no} 읽기 실패 (시도 {attempt + 1}/{MAX_RETRIES}). {delay * 1000:.0f}ms 후 재시도... 오류: {e}")
+                        time.sleep(delay)
                 
                 if not read_success:
                     print(f"\n오류: 페이지 {page_no} 최종 읽기 실패. 0xFF로 채웁니다.")
@@ -1,13 +1,89 @@
 import RPi.GPIO as GPIO
+from array import array
+import atexit
+import mmap
+import os
 import time
 
 #2
 
+# BCM2835 GPIO 레지스터 (/dev/gpiomem 기준 32비트 워드 인덱스)
+GPFSEL0 = 0x00 // 4  # 기능 선택 (핀당 3비트)
+GPSET0 = 0x1C // 4   # 1을 쓴 비트의 핀을 HIGH로
+GPCLR0 = 0x28 // 4   # 1을 쓴 비트의 핀을 LOW로
+GPLEV0 = 0x34 // 4   # 핀 0-31의 현재 레벨
+
+
+class _GpioMem:
+    """
+    /dev/gpiomem을 mmap하여 BCM2835 GPIO 레지스터에 직접 접근합니다.
+    GPIO.output()/GPIO.input()은 핀 하나마다 라이브러리 호출을 거치지만,
+    여기서는 GPSET0/GPCLR0 쓰기 한 번으로 여러 핀을 동시에 바꾸고 GPLEV0 읽기 한 번으로 모든 핀 레벨을 얻습니다.
+    최초 핀 설정(GPIO.setup)과 cleanup은 계속 RPi.GPIO가 담당하고,
+    데이터 버스 방향 전환은 GPFSEL 레지스터를 직접 고쳐 씁니다 (set_functions).
+    드라이버 인스턴스가 여러 개여도 매핑은 instance()로 하나만 공유하며, GPIO 정리는 프로세스 종료 시 한 번 수행합니다.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "_GpioMem":
+        """공유 매핑을 반환 (최초 호출 시 생성하고 종료 시 GPIO.cleanup을 등록)"""
+        if cls._instance is None:
+            cls._instance = cls()
+            atexit.register(GPIO.cleanup)
+        return cls._instance
+
+    def __init__(self, path: str = "/dev/gpiomem"):
+        fd = os.open(path, os.O_RDWR | os.O_SYNC)
+        try:
+            self._mm = mmap.mmap(fd, mmap.PAGESIZE, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        finally:
+            os.close(fd)
+        self.regs = memoryview(self._mm).cast('I')
+
+    def output(self, pin: int, value: int):
+        """GPIO.output(pin, value)와 동일한 동작 (레지스터 1회 쓰기)"""
+        self.regs[GPSET0 if value else GPCLR0] = 1 << pin
+
+    def input(self, pin: int) -> int:
+        """GPIO.input(pin)과 동일한 동작 (레지스터 1회 읽기)"""
+        return (self.regs[GPLEV0] >> pin) & 1
+
+    def write_masks(self, set_mask: int, clr_mask: int):
+        """set_mask 비트의 핀은 HIGH, clr_mask 비트의 핀은 LOW로 설정"""
+        self.regs[GPSET0] = set_mask
+        self.regs[GPCLR0] = clr_mask
+
+    def levels(self) -> int:
+        """핀 0-31의 레벨을 32비트 값 하나로 반환"""
+        return self.regs[GPLEV0]
+
+    def set_functions(self, fsel_updates):
+        """
+        (GPFSEL 워드 인덱스, 지울 비트 마스크, 설정할 비트) 목록대로 기능 선택 레지스터를 고쳐 씁니다.
+        한 워드에 속한 핀(10개)들의 방향을 읽기-수정-쓰기 한 번으로 함께 바꿉니다.
+        """
+        regs = self.regs
+        for index, clear_mask, bits in fsel_updates:
+            regs[index] = (regs[index] & ~clear_mask) | bits
+
+    @staticmethod
+    def fsel_updates(pins, mode: int) -> tuple:
+        """pins를 mode(0=입력, 1=출력)로 바꾸기 위한 set_functions 인자를 GPFSEL 워드별로 묶어 만듭니다."""
+        words = {}
+        for pin in pins:
+            index, shift = GPFSEL0 + pin // 10, (pin % 10) * 3
+            clear_mask, bits = words.get(index, (0, 0))
+            words[index] = (clear_mask | (0b111 << shift), bits | (mode << shift))
+        return tuple((index, clear_mask, bits) for index, (clear_mask, bits) in sorted(words.items()))
+
 class MT29F4G08ADADA:
     # NAND 플래시 상수
     PAGE_SIZE = 2048
     SPARE_SIZE = 64
     PAGES_PER_BLOCK = 64
+    BLOCK_SHIFT = 6  # 블록 번호 = page_no >> BLOCK_SHIFT (PAGES_PER_BLOCK = 2^6)
     TOTAL_BLOCKS = 4096
     
     # 타이밍 상수 (ns) - 데이터시트의 Max/Min 값과 충분한 여유를 고려하여 재조정
@@ -33,7 +109,16 @@ class MT29F4G08ADADA:
     # tDH (Data hold time): 데이터시트 3.3V Min 5ns, 1.8V Min 5ns. 여유롭게 10ns. 
     tDH = 10
 
+    # 이 이상(ns)의 지연은 반복 횟수 추정 대신 perf_counter_ns 기한까지 스핀 (시계 호출 비용이 상대적으로 작음)
+    DELAY_DEADLINE_NS = 1000
+
+    # 페이지 패딩용 0xFF 버퍼 (메인+스페어)
+    _FF_PAGE = b'\xFF' * (PAGE_SIZE + SPARE_SIZE)
+
     def __init__(self, skip_bad_block_scan=False):
+        # 지연 루프 보정 (perf_counter_ns 반복 호출 없이 _delay_ns 수행)
+        self._calibrate_delay()
+
         # GPIO 핀 설정
         self.RB = 13  # Ready/Busy
         self.RE = 26  # Read Enable
@@ -45,13 +130,48 @@ class MT29F4G08ADADA:
         # 데이터 핀
         self.IO_pins = [21, 20, 16, 12, 25, 24, 23, 18] # IO0-IO7
         
+        # 데이터 버스(IO0-IO7) 전체에 해당하는 레지스터 비트 마스크
+        self._io_mask = 0
+        for pin in self.IO_pins:
+            self._io_mask |= 1 << pin
+
+        # 데이터 버스 방향 전환용 GPFSEL 갱신 목록 (IO 핀 8개가 걸친 GPFSEL1/GPFSEL2 워드별 한 번씩)
+        self._fsel_io_out = _GpioMem.fsel_updates(self.IO_pins, 0b001)
+        self._fsel_io_in = _GpioMem.fsel_updates(self.IO_pins, 0b000)
+
+        # 바이트 값(0-255) -> (GPSET0 마스크, GPCLR0 마스크) 변환 테이블
+        # _we_clr_tbl은 0 비트 클리어와 WE# LOW를 한 번의 GPCLR0 쓰기로 묶은 마스크
+        self._set_tbl = array('I', [0] * 256)
+        self._clr_tbl = array('I', [0] * 256)
+        self._we_clr_tbl = array('I', [0] * 256)
+        for value in range(256):
+            set_mask = 0
+            for i, pin in enumerate(self.IO_pins):
+                if (value >> i) & 1:
+                    set_mask |= 1 << pin
+            self._set_tbl[value] = set_mask
+            self._clr_tbl[value] = self._io_mask ^ set_mask
+            self._we_clr_tbl[value] = self._clr_tbl[value] | (1 << self.WE)
+
+        # GPLEV0 -> 바이트 값 역변환 테이블
+        # IO 핀(12~25번)이 걸친 비트 구간만 잘라 인덱스로 사용하고, 구간 안의 다른 핀(R/B#, CE# 등)은 마스크로 제거
+        self._io_shift = min(self.IO_pins)
+        self._io_window = self._io_mask >> self._io_shift
+        self._lev_tbl = array('B', bytes(self._io_window + 1))
+        for value in range(256):
+            self._lev_tbl[self._set_tbl[value] >> self._io_shift] = value
+
         # Bad Block 테이블 초기화
         self.bad_blocks = set()
 
+        # 핀 토글/레벨 읽기용 GPIO 레지스터 매핑 (프로세스 내 첫 인스턴스만 생성)
+        first_instance = _GpioMem._instance is None
         try:
-            # GPIO 초기화
-            GPIO.cleanup()  # 이전 설정 초기화
-            time.sleep(0.1)  # 초기화 후 잠시 대기
+            self._gpio = _GpioMem.instance()
+
+            # GPIO 초기화 (다른 인스턴스가 사용 중인 설정은 지우지 않음)
+            if first_instance:
+                GPIO.cleanup()  # 이전 설정 초기화
             
             GPIO.setmode(GPIO.BCM)  # BCM 모드로 명시적 설정
             GPIO.setwarnings(False)
@@ -68,10 +188,8 @@ class MT29F4G08ADADA:
             for pin in self.IO_pins:
                 GPIO.setup(pin, GPIO.OUT, initial=GPIO.HIGH)
                 
-            # 초기 상태 설정
-            time.sleep(0.001)  # 1ms 대기
+            # 초기 상태 설정 (reset_pins가 자체적으로 안정화 대기를 포함)
             self.reset_pins()
-            time.sleep(0.001)  # 1ms 대기
             
             # 파워온 시퀀스
             self.power_on_sequence()
@@ -79,39 +197,69 @@ class MT29F4G08ADADA:
             self.disable_internal_ecc()
             
         except Exception as e:
-            GPIO.cleanup()
+            if first_instance:
+                GPIO.cleanup()
             raise RuntimeError(f"GPIO 초기화 실패: {str(e)}")
 
+    def _calibrate_delay(self, iterations: int = 20000, rounds: int = 5):
+        """
+        _delay_ns에서 사용할 빈 루프 1회당 시간(ns)과 _delay_ns 호출 자체의 비용을 측정합니다.
+        CPU 클럭 변동이 있어도 지연이 짧아지지 않도록 여러 번 측정해 가장 빠른 값을 사용합니다.
+        """
+        self._ns_per_iter = 1.0
+        self._min_op_ns = 0
+        best = None
+        for _ in range(rounds):
+            start = time.perf_counter_ns()
+            for _ in range(iterations):
+                pass
+            elapsed = (time.perf_counter_ns() - start) / iterations
+            best = elapsed if best is None else min(best, elapsed)
+        self._ns_per_iter = max(best, 0.001)
+
+        # 이보다 짧은 지연은 _delay_ns 호출에 드는 시간만으로 이미 충족됨
+        start = time.perf_counter_ns()
+        for _ in range(1000):
+            self._delay_ns(0)
+        self._min_op_ns = (time.perf_counter_ns() - start) / 1000
+
     def _delay_ns(self, nanoseconds: int):
-        """나노초 단위의 정밀한 시간 지연을 수행합니다 (비지 웨이트)."""
-        if nanoseconds <= 0:
+        """
+        나노초 단위의 시간 지연을 수행합니다.
+        짧은 지연은 보정된 빈 루프 반복으로, DELAY_DEADLINE_NS 이상은 perf_counter_ns 기한까지 비지 웨이트합니다.
+        (보정 후 인터프리터 최적화/CPU 클럭 상승으로 반복이 빨라지면 긴 지연이 요청보다 짧아질 수 있으므로)
+        """
+        if nanoseconds <= self._min_op_ns:
+            return
+        if nanoseconds >= self.DELAY_DEADLINE_NS:
+            deadline = time.perf_counter_ns() + nanoseconds
+            while time.perf_counter_ns() < deadline:
+                pass
             return
-        end_time = time.perf_counter_ns() + nanoseconds
-        while time.perf_counter_ns() < end_time:
+        for _ in range(int(nanoseconds / self._ns_per_iter)):
             pass
             
     def reset_pins(self):
         """핀 상태를 안전한 기본값으로 리셋"""
         try:
-            GPIO.output(self.CE, GPIO.HIGH)  # Chip Disable
-            GPIO.output(self.RE, GPIO.HIGH)  # Read Disable
-            GPIO.output(self.WE, GPIO.HIGH)  # Write Disable
-            GPIO.output(self.CLE, GPIO.LOW)  # Command Latch Disable
-            GPIO.output(self.ALE, GPIO.LOW)  # Address Latch Disable
+            self._gpio.output(self.CE, GPIO.HIGH)  # Chip Disable
+            self._gpio.output(self.RE, GPIO.HIGH)  # Read Disable
+            self._gpio.output(self.WE, GPIO.HIGH)  # Write Disable
+            self._gpio.output(self.CLE, GPIO.LOW)  # Command Latch Disable
+            self._gpio.output(self.ALE, GPIO.LOW)  # Address Latch Disable
             
             # 데이터 핀을 출력 모드로 설정하고 HIGH로 설정
-            for pin in self.IO_pins:
-                GPIO.setup(pin, GPIO.OUT)
-                GPIO.output(pin, GPIO.HIGH)
+            self._gpio.set_functions(self._fsel_io_out)
+            self._gpio.write_masks(self._io_mask, 0)
                 
             self._delay_ns(200)  # 100ns -> 200ns 대기
         except Exception as e:
             raise RuntimeError(f"핀 리셋 실패: {str(e)}")
             
     def __del__(self):
+        # GPIO.cleanup은 공유 매핑과 함께 atexit에서 한 번만 수행 (다른 인스턴스가 사용 중일 수 있음)
         try:
             self.reset_pins()
-            GPIO.cleanup()
         except:
             pass
 
@@ -141,42 +289,43 @@ class MT29F4G08ADADA:
     def check_operation_status(self):
         """작업 상태 확인 - 개선된 버전"""
         try:
-            # 상태 읽기 명령
-            GPIO.output(self.CE, GPIO.LOW)
-            GPIO.output(self.CLE, GPIO.HIGH)
-            GPIO.output(self.ALE, GPIO.LOW)
-            self._delay_ns(self.tCLS)  # CLE setup time
-            
-            GPIO.output(self.WE, GPIO.LOW)
-            self._delay_ns(self.tWP)
-            self.write_data(0x70)  # Read Status command
-            GPIO.output(self.WE, GPIO.HIGH)
-            self._delay_ns(self.tWH)
-            
-            GPIO.output(self.CLE, GPIO.LOW)
-            self._delay_ns(self.tCLH)  # CLE hold time
-            self._delay_ns(self.tWHR)  # WE# high to RE# low
-            
-            # 상태 바이트 읽기
-            self.set_data_pins_input()
-            GPIO.output(self.RE, GPIO.LOW)
-            self._delay_ns(self.tREA)  # RE# access time
-            status = self.read_data()
-            GPIO.output(self.RE, GPIO.HIGH)
-            self._delay_ns(self.tREH)  # RE# high hold time
-            
-            GPIO.output(self.CE, GPIO.HIGH)
-            self.set_data_pins_output()
-            
+            status = self.read_status()
+
             if status & 0x01:  # Fail bit
                 print(f"상태 확인 실패: 0x{status:02X}")
                 return False
             return True
-            
+
         except Exception as e:
             print(f"상태 확인 중 오류: {str(e)}")
             return False
 
+    def read_status(self) -> int:
+        """READ STATUS(70h) 명령으로 상태 레지스터 값을 읽어 그대로 반환합니다."""
+        # 상태 읽기 명령
+        self._gpio.output(self.CE, GPIO.LOW)
+        self._gpio.output(self.CLE, GPIO.HIGH)
+        self._gpio.output(self.ALE, GPIO.LOW)
+        self._delay_ns(self.tCLS)  # CLE setup time
+
+        self._emit_bytes((0x70,))  # Read Status command
+
+        self._gpio.output(self.CLE, GPIO.LOW)
+        self._delay_ns(self.tCLH)  # CLE hold time
+        self._delay_ns(self.tWHR)  # WE# high to RE# low
+
+        # 상태 바이트 읽기
+        self.set_data_pins_input()
+        self._gpio.output(self.RE, GPIO.LOW)
+        self._delay_ns(self.tREA)  # RE# access time
+        status = self.read_data()
+        self._gpio.output(self.RE, GPIO.HIGH)
+        self._delay_ns(self.tREH)  # RE# high hold time
+
+        self._gpio.output(self.CE, GPIO.HIGH)
+        self.set_data_pins_output()
+        return status
+
     def power_on_sequence(self):
         """파워온 시퀀스 수행"""
         try:
@@ -184,11 +333,11 @@ class MT29F4G08ADADA:
             time.sleep(0.001)  # 1ms 대기
             
             # 2. 모든 컨트롤 신호를 HIGH로 설정
-            GPIO.output(self.CE, GPIO.HIGH)
-            GPIO.output(self.RE, GPIO.HIGH)
-            GPIO.output(self.WE, GPIO.HIGH)
-            GPIO.output(self.CLE, GPIO.LOW)
-            GPIO.output(self.ALE, GPIO.LOW)
+            self._gpio.output(self.CE, GPIO.HIGH)
+            self._gpio.output(self.RE, GPIO.HIGH)
+            self._gpio.output(self.WE, GPIO.HIGH)
+            self._gpio.output(self.CLE, GPIO.LOW)
+            self._gpio.output(self.ALE, GPIO.LOW)
             
             # 3. 추가 대기
             time.sleep(0.0002)  # 200us
@@ -199,9 +348,9 @@ class MT29F4G08ADADA:
                     self.write_command(0xFF)
                     
                     # R/B# 신호가 LOW로 변경되는지 확인
-                    timeout_start = time.time()
-                    while GPIO.input(self.RB) == GPIO.HIGH:
-                        if time.time() - timeout_start > 0.001:  # 1ms 타임아웃
+                    timeout_start = time.monotonic_ns()  # 시스템 시각 변경 영향 없는 정수 ns 시계
+                    while self._gpio.input(self.RB) == GPIO.HIGH:
+                        if time.monotonic_ns() - timeout_start > 1_000_000:  # 1ms 타임아웃
                             break
                         time.sleep(0.0001)  # 100us 대기
                     
@@ -217,8 +366,35 @@ class MT29F4G08ADADA:
         except Exception as e:
             raise RuntimeError(f"파워온 시퀀스 실패: {str(e)}")
             
-    def wait_ready(self):
-        """R/B# 핀이 Ready(HIGH) 상태가 될 때까지 대기 - 개선된 버전"""
+    def _wait_rb_high(self, timeout_ns: int, edge: bool = False) -> bool:
+        """
+        R/B#가 HIGH가 되거나 timeout_ns가 지날 때까지 GPLEV0의 R/B# 비트를 직접 읽으며 대기합니다. (Ready이면 True)
+        edge=True는 tPROG/tBERS처럼 긴 대기용으로, 커널 상승 에지 대기로 CPU를 양보합니다.
+        에지 대기를 거는 사이에 이미 지나간 에지는 보이지 않으므로 1ms마다 레벨을 재확인하고,
+        에지 검출 설정이 실패(RuntimeError)하면 레지스터 폴링으로 전환합니다.
+        """
+        regs = self._gpio.regs
+        rb_bit = 1 << self.RB
+        if regs[GPLEV0] & rb_bit:
+            return True
+        _now = time.perf_counter_ns
+        deadline = _now() + timeout_ns
+        while not regs[GPLEV0] & rb_bit:
+            if _now() > deadline:
+                return False
+            if edge:
+                try:
+                    GPIO.wait_for_edge(self.RB, GPIO.RISING, timeout=1)
+                except RuntimeError:
+                    edge = False  # 예: conflicting edge detection -> 폴링으로 계속
+        return True
+
+    def wait_ready(self, long_wait: bool = False):
+        """
+        R/B# 핀이 Ready(HIGH) 상태가 될 때까지 대기 - 개선된 버전
+        tR/tRCBSY/tFEAT처럼 짧은 Busy는 에지 대기를 거는 동안 끝나 버려 타임아웃까지 기다리게 되므로
+        레지스터를 직접 폴링하고, long_wait=True(tPROG, tBERS)일 때만 에지 대기를 사용합니다.
+        """
         # tWB 대기
         self._delay_ns(self.tWB)  # 200ns
         
@@ -227,13 +403,7 @@ class MT29F4G08ADADA:
         max_retries = 10  # 5 -> 10으로 증가
         
         while retry_count < max_retries:
-            timeout_start = time.time()
-            while GPIO.input(self.RB) == GPIO.LOW:
-                if time.time() - timeout_start > 0.02:
-                    break
-                time.sleep(0.0001)
-                
-            if GPIO.input(self.RB) == GPIO.HIGH:
+            if self._wait_rb_high(20_000_000, edge=long_wait):  # 20ms
                 # 추가 안정화 대기
                 self._delay_ns(100)
                 return  # Ready 상태 확인
@@ -245,15 +415,13 @@ class MT29F4G08ADADA:
         raise RuntimeError("R/B# 시그널 타임아웃")
             
     def set_data_pins_output(self):
-        """데이터 핀을 출력 모드로 설정"""
-        for pin in self.IO_pins:
-            GPIO.setup(pin, GPIO.OUT)
+        """데이터 핀을 출력 모드로 설정 (핀별 GPIO.setup 대신 GPFSEL 워드 단위로 한 번에)"""
+        self._gpio.set_functions(self._fsel_io_out)
         self._delay_ns(200)  # 100ns -> 200ns 대기
             
     def set_data_pins_input(self):
-        """데이터 핀을 입력 모드로 설정"""
-        for pin in self.IO_pins:
-            GPIO.setup(pin, GPIO.IN)
+        """데이터 핀을 입력 모드로 설정 (핀별 GPIO.setup 대신 GPFSEL 워드 단위로 한 번에)"""
+        self._gpio.set_functions(self._fsel_io_in)
         self._delay_ns(200)  # 100ns -> 200ns 대기
             
     def write_data(self, data):
@@ -261,11 +429,9 @@ class MT29F4G08ADADA:
         # WE# 사이클 타임 준수
         cycle_start = time.perf_counter_ns()
         
-        # 데이터 설정
-        for i in range(8):
-            GPIO.output(self.IO_pins[i], (data >> i) & 1)
-            self._delay_ns(1)
-            
+        # 데이터 설정 (미리 계산한 마스크로 8개 IO 핀을 GPSET0/GPCLR0 한 쌍의 쓰기로 동시에 구동)
+        self._gpio.write_masks(self._set_tbl[data], self._clr_tbl[data])
+
         # 데이터 설정 후 안정화 대기
         #self._delay_ns(50)  # 추가된 안정화 대기
         # 데이터 설정 후 안정화 대기 (tDS: Data setup time 확보)
@@ -276,52 +442,107 @@ class MT29F4G08ADADA:
         if elapsed < self.tWC:
             self._delay_ns(self.tWC - elapsed)
 
+    def _emit_bytes(self, data):
+        """
+        data의 각 바이트를 WE# 스트로브와 함께 버스에 내보냅니다.
+        (데이터 구동 + WE# LOW -> tWP -> WE# HIGH -> tWH)
+        바이트마다 write_data()/GPIO 호출을 거치지 않고 레지스터에 직접 쓰는 하나의 루프로 처리합니다.
+        WE#와 IO 핀이 같은 GPIO 뱅크에 있으므로 데이터 0 비트 클리어와 WE# LOW를 한 번의 쓰기로 묶어
+        바이트당 레지스터 쓰기는 3회입니다. 데이터는 상승 에지에서 래치되므로 tWP 동안 tDS가 확보됩니다.
+        CE#/CLE/ALE는 호출 전에 원하는 상태로 맞춰 두어야 합니다.
+        """
+        regs = self._gpio.regs
+        set_tbl = self._set_tbl
+        we_clr_tbl = self._we_clr_tbl
+        we_mask = 1 << self.WE
+        gset = GPSET0
+        gclr = GPCLR0
+        delay = self._delay_ns
+        tWP = self.tWP
+        tWH = self.tWH
+
+        # tWP/tWH가 _delay_ns 호출 비용보다 짧으면 delay()는 아무것도 하지 않고 반환하므로
+        # 호출 자체를 빼고, 레지스터 쓰기 사이의 간격만으로 펄스 폭을 확보한다
+        if tWP <= self._min_op_ns and tWH <= self._min_op_ns:
+            for byte in data:
+                regs[gset] = set_tbl[byte]
+                regs[gclr] = we_clr_tbl[byte]
+                regs[gset] = we_mask
+            return
+
+        for byte in data:
+            regs[gset] = set_tbl[byte]       # 데이터 1 비트 구동
+            regs[gclr] = we_clr_tbl[byte]    # 데이터 0 비트 + WE# LOW
+            delay(tWP)                       # WE# pulse width (tDS 포함)
+            regs[gset] = we_mask             # WE# HIGH (상승 에지에서 래치)
+            delay(tWH)                       # WE# high hold time
+
     def read_data(self):
         """8비트 데이터 읽기 (RE# 사이클 없이 순수 GPIO 읽기)"""
         # RE# 사이클은 상위 함수에서 처리됨
         # 여기서는 GPIO 핀 상태만 읽음
         self._delay_ns(self.tREA)  # RE# access time 대기
         
-        data = 0
-        for i in range(8):
-            data |= GPIO.input(self.IO_pins[i]) << i
-            
-        return data
+        # GPLEV0 한 번 읽고 역변환 테이블로 IO0-IO7 비트를 모은다
+        return self._lev_tbl[(self._gpio.levels() >> self._io_shift) & self._io_window]
+
+    def _read_bytes(self, length: int, out=None):
+        """
+        RE# 스트로브와 함께 length 바이트를 읽습니다.
+        (RE# LOW -> tREA -> GPLEV0 읽기 -> RE# HIGH -> tREH)
+        _emit_bytes와 같이 핀 번호/마스크/타이밍을 지역 변수로 고정한 하나의 루프에서 레지스터를 직접 다룹니다.
+        CE#는 호출 전에 LOW, 데이터 핀은 입력 모드여야 합니다.
+        out(쓰기 가능한 버퍼)을 주면 새 bytes를 만들지 않고 out에 채워 그대로 반환합니다.
+        """
+        regs = self._gpio.regs
+        lev_tbl = self._lev_tbl
+        io_shift = self._io_shift
+        io_window = self._io_window
+        re_mask = 1 << self.RE
+        gset = GPSET0
+        gclr = GPCLR0
+        glev = GPLEV0
+        delay = self._delay_ns
+        tREA = self.tREA
+        tREH = self.tREH
+
+        reuse = out is not None
+        if not reuse:
+            out = bytearray(length)
+        for i in range(length):
+            regs[gclr] = re_mask                                    # RE# LOW
+            delay(tREA)                                             # RE# access time
+            out[i] = lev_tbl[(regs[glev] >> io_shift) & io_window]  # 데이터 읽기
+            regs[gset] = re_mask                                    # RE# HIGH
+            delay(tREH)                                             # RE# high hold time
+        return out if reuse else bytes(out)
         
     def write_command(self, cmd):
         """커맨드 쓰기 - 개선된 타이밍"""
-        GPIO.output(self.CE, GPIO.LOW)
+        self._gpio.output(self.CE, GPIO.LOW)
         self._delay_ns(50)  # CE# setup time
         
-        GPIO.output(self.CLE, GPIO.HIGH)
+        self._gpio.output(self.CLE, GPIO.HIGH)
         self._delay_ns(self.tCLS)  # CLE setup time
-        GPIO.output(self.ALE, GPIO.LOW)
+        self._gpio.output(self.ALE, GPIO.LOW)
         
-        GPIO.output(self.WE, GPIO.LOW)
-        self._delay_ns(self.tWP)  # WE# pulse width
-        self.write_data(cmd)
-        GPIO.output(self.WE, GPIO.HIGH)
-        self._delay_ns(self.tWH)  # WE# high hold time
+        self._emit_bytes((cmd,))
         
-        GPIO.output(self.CLE, GPIO.LOW)
+        self._gpio.output(self.CLE, GPIO.LOW)
         self._delay_ns(self.tCLH)  # CLE hold time
 
     def write_address(self, addr):
         """주소 쓰기 - 개선된 타이밍"""
-        GPIO.output(self.CE, GPIO.LOW)   # Chip Enable
+        self._gpio.output(self.CE, GPIO.LOW)   # Chip Enable
         self._delay_ns(50)  # CE# setup time
         
-        GPIO.output(self.CLE, GPIO.LOW)  # Command Latch Disable
-        GPIO.output(self.ALE, GPIO.HIGH) # Address Latch Enable
+        self._gpio.output(self.CLE, GPIO.LOW)  # Command Latch Disable
+        self._gpio.output(self.ALE, GPIO.HIGH) # Address Latch Enable
         self._delay_ns(self.tALS)  # ALE setup time
         
-        GPIO.output(self.WE, GPIO.LOW)   # Write Enable
-        self._delay_ns(self.tWP)  # WE# pulse width
-        self.write_data(addr)
-        GPIO.output(self.WE, GPIO.HIGH)  # Write Disable
-        self._delay_ns(self.tWH)  # WE# high hold time
+        self._emit_bytes((addr,))
         
-        GPIO.output(self.ALE, GPIO.LOW)  # Address Latch Disable
+        self._gpio.output(self.ALE, GPIO.LOW)  # Address Latch Disable
         self._delay_ns(self.tALH)  # ALE hold time
         self._delay_ns(self.tADL)  # ALE to data loading time
 
@@ -335,37 +556,27 @@ class MT29F4G08ADADA:
             self.write_command(0xEF)
 
             # [2] Feature Address (90h) 전송
-            GPIO.output(self.CE, GPIO.LOW)
-            GPIO.output(self.CLE, GPIO.LOW)
-            GPIO.output(self.ALE, GPIO.HIGH)
+            self._gpio.output(self.CE, GPIO.LOW)
+            self._gpio.output(self.CLE, GPIO.LOW)
+            self._gpio.output(self.ALE, GPIO.HIGH)
             self._delay_ns(self.tALS)
 
-            GPIO.output(self.WE, GPIO.LOW)
-            self._delay_ns(self.tWP)
-            self.write_data(0x90)  # Feature Address
-            GPIO.output(self.WE, GPIO.HIGH)
-            self._delay_ns(self.tWH)
+            self._emit_bytes((0x90,))  # Feature Address
             
-            GPIO.output(self.ALE, GPIO.LOW)
+            self._gpio.output(self.ALE, GPIO.LOW)
             self._delay_ns(self.tALH)
             self._delay_ns(self.tADL)
 
             # [3] Parameters (P1=08h for ECC Enable, P2-P4=00h) 전송
             params = [0x08, 0x00, 0x00, 0x00]
-            GPIO.output(self.CE, GPIO.LOW)
-            GPIO.output(self.CLE, GPIO.LOW)
-            GPIO.output(self.ALE, GPIO.LOW)
-
-            for p in params:
-                GPIO.output(self.WE, GPIO.LOW)
-                self._delay_ns(self.tWP)
-                self.write_data(p)
-                GPIO.output(self.WE, GPIO.HIGH)
-                self._delay_ns(self.tWH)
-            
-            # [4] tFEAT 대기
+            self._gpio.output(self.CE, GPIO.LOW)
+            self._gpio.output(self.CLE, GPIO.LOW)
+            self._gpio.output(self.ALE, GPIO.LOW)
+
+            self._emit_bytes(params)
+            
+            # [4] tFEAT 대기 (R/B#가 Ready가 되면 설정 완료)
             self.wait_ready()
-            time.sleep(0.001)
             
             # [5] ECC 상태 검증 - GET FEATURES로 확인
             print("ECC 활성화 상태를 검증합니다...")
@@ -381,18 +592,18 @@ class MT29F4G08ADADA:
             
             # 4바이트 파라미터 읽기
             self.set_data_pins_input()
-            GPIO.output(self.CE, GPIO.LOW)
+            self._gpio.output(self.CE, GPIO.LOW)
             
             params_read = []
             for _ in range(4):
-                GPIO.output(self.RE, GPIO.LOW)
+                self._gpio.output(self.RE, GPIO.LOW)
                 self._delay_ns(self.tREA)
                 byte_data = self.read_data()
-                GPIO.output(self.RE, GPIO.HIGH)
+                self._gpio.output(self.RE, GPIO.HIGH)
                 self._delay_ns(self.tREH)
                 params_read.append(byte_data)
             
-            GPIO.output(self.CE, GPIO.HIGH)
+            self._gpio.output(self.CE, GPIO.HIGH)
             
             # [6] P1 파라미터 검증
             p1_value = params_read[0]
@@ -428,19 +639,13 @@ class MT29F4G08ADADA:
 
             # Parameters (P1=00h for ECC Disable, P2-P4=00h) 전송 [cite: 1520, 1531]
             params = [0x00, 0x00, 0x00, 0x00]
-            GPIO.output(self.CE, GPIO.LOW)
-            GPIO.output(self.CLE, GPIO.LOW)
-            GPIO.output(self.ALE, GPIO.LOW)
+            self._gpio.output(self.CE, GPIO.LOW)
+            self._gpio.output(self.CLE, GPIO.LOW)
+            self._gpio.output(self.ALE, GPIO.LOW)
             self.set_data_pins_output() # 데이터 핀을 출력으로 설정
-            for p in params:
-                GPIO.output(self.WE, GPIO.LOW)
-                self._delay_ns(self.tWP)
-                self.write_data(p)
-                GPIO.output(self.WE, GPIO.HIGH)
-                self._delay_ns(self.tWH)
-            # [4] tFEAT 시간 대기 (기능 설정 완료까지)
+            self._emit_bytes(params)
+            # [4] tFEAT 시간 대기 (기능 설정 완료까지, R/B#가 Ready가 되면 완료)
             self.wait_ready()
-            time.sleep(0.001)  # 명령이 완전히 처리될 시간을 보장
             
             # [5] ECC 상태 검증 - GET FEATURES로 확인
             print("ECC 비활성화 상태를 검증합니다...")
@@ -456,18 +661,18 @@ class MT29F4G08ADADA:
             
             # 4바이트 파라미터(P1-P4) 읽기
             self.set_data_pins_input()
-            GPIO.output(self.CE, GPIO.LOW)
+            self._gpio.output(self.CE, GPIO.LOW)
             
             params_read = []
             for _ in range(4):
-                GPIO.output(self.RE, GPIO.LOW)
+                self._gpio.output(self.RE, GPIO.LOW)
                 self._delay_ns(self.tREA)
                 byte_data = self.read_data()
-                GPIO.output(self.RE, GPIO.HIGH)
+                self._gpio.output(self.RE, GPIO.HIGH)
                 self._delay_ns(self.tREH)
                 params_read.append(byte_data)
             
-            GPIO.output(self.CE, GPIO.HIGH)
+            self._gpio.output(self.CE, GPIO.HIGH)
             
             # [6] P1 파라미터 검증
             p1_value = params_read[0]
@@ -536,14 +741,14 @@ class MT29F4G08ADADA:
                     
                     # [5] 1바이트 읽기
                     self.set_data_pins_input()
-                    GPIO.output(self.CE, GPIO.LOW)
+                    self._gpio.output(self.CE, GPIO.LOW)
                     
-                    GPIO.output(self.RE, GPIO.LOW)
+                    self._gpio.output(self.RE, GPIO.LOW)
                     self._delay_ns(self.tREA) # RE# access time
                     marker_byte = self.read_data()
-                    GPIO.output(self.RE, GPIO.HIGH)
+                    self._gpio.output(self.RE, GPIO.HIGH)
                     
-                    GPIO.output(self.CE, GPIO.HIGH)
+                    self._gpio.output(self.CE, GPIO.HIGH)
                     self.set_data_pins_output()
 
                     # [6] Bad Block 마크(0x00) 확인
@@ -573,6 +778,12 @@ class MT29F4G08ADADA:
             current_block += 1
         raise RuntimeError("사용 가능한 블록이 없습니다")
 
+    def _pad_page(self, data, size: int) -> bytearray:
+        """data 뒤를 0xFF로 채워 size 바이트 버퍼를 만듭니다 (할당 1회 + 복사 1회)."""
+        buf = bytearray(memoryview(self._FF_PAGE)[:size])
+        buf[:len(data)] = data
+        return buf
+
     def write_page(self, page_no: int, data: bytes):
         """한 페이지 쓰기 (내장 하드웨어 ECC 사용) - 개선된 버전"""
         # 데이터 크기 유효성 검사 (페이지 크기만 확인)
@@ -581,11 +792,11 @@ class MT29F4G08ADADA:
         
         # 페이지 크기에 맞게 데이터 패딩
         if len(data) < self.PAGE_SIZE:
-            data += b'\xFF' * (self.PAGE_SIZE - len(data))
+            data = self._pad_page(data, self.PAGE_SIZE)
 
         try:
             self.validate_page(page_no)
-            block_no = page_no // self.PAGES_PER_BLOCK
+            block_no = page_no >> self.BLOCK_SHIFT
             if self.is_bad_block(block_no):
                 raise RuntimeError(f"Bad Block({block_no})에 쓰기 시도")
             
@@ -597,26 +808,17 @@ class MT29F4G08ADADA:
             
             # [3] 데이터 전송 (개선된 타이밍)
             self.set_data_pins_output()
-            GPIO.output(self.CE, GPIO.LOW)
-            GPIO.output(self.CLE, GPIO.LOW)
-            GPIO.output(self.ALE, GPIO.LOW)
-            
-            for byte_idx, byte in enumerate(data):
-                GPIO.output(self.WE, GPIO.LOW)
-                self._delay_ns(self.tWP) # WE# pulse width
-                self.write_data(byte)
-                GPIO.output(self.WE, GPIO.HIGH)
-                self._delay_ns(self.tWH) # WE# high hold time
-                
-                # 매 256바이트마다 짧은 대기 (버퍼링 고려)
-                if (byte_idx + 1) % 256 == 0:
-                    self._delay_ns(1000)  # 1us 대기
-                
+            self._gpio.output(self.CE, GPIO.LOW)
+            self._gpio.output(self.CLE, GPIO.LOW)
+            self._gpio.output(self.ALE, GPIO.LOW)
+            
+            self._emit_bytes(data)
+
             # [4] 쓰기 확정 명령 (10h)
             self.write_command(0x10)
             
             # [5] tPROG_ECC 대기
-            self.wait_ready()
+            self.wait_ready(long_wait=True)
             
             # [6] 상태 확인
             if not self.check_operation_status():
@@ -628,12 +830,15 @@ class MT29F4G08ADADA:
         finally:
             self.reset_pins()
 
-    def read_page(self, page_no: int, length: int = 2048):
-        """한 페이지 읽기 (내장 하드웨어 ECC 사용) - 개선된 버전"""
+    def read_page(self, page_no: int, length: int = 2048, out=None):
+        """
+        한 페이지 읽기 (내장 하드웨어 ECC 사용) - 개선된 버전
+        out(길이 length 이상의 bytearray/memoryview)을 주면 페이지마다 새 버퍼를 할당하지 않고 out에 읽어 반환합니다.
+        """
         try:
             self.validate_page(page_no)
-            if self.is_bad_block(page_no // self.PAGES_PER_BLOCK):
-                raise RuntimeError(f"Bad Block({page_no // self.PAGES_PER_BLOCK}) 읽기 시도")
+            if self.is_bad_block(page_no >> self.BLOCK_SHIFT):
+                raise RuntimeError(f"Bad Block({page_no >> self.BLOCK_SHIFT}) 읽기 시도")
             
             # [1] 읽기 명령 및 주소 전송 (00h)
             self.write_command(0x00)
@@ -649,7 +854,10 @@ class MT29F4G08ADADA:
             status = self.check_read_status()
             if status == "UNCORRECTABLE_ERROR":
                 print(f"경고: 페이지 {page_no}에서 수정 불가능한 ECC 오류 발생!")
-                # 수정 불가능한 경우, FF로 채워진 데이터를 반환하거나 예외 발생
+                # 수정 불가능한 경우, FF로 채워진 데이터를 반환 (out이 있으면 out을 FF로 채워 반환)
+                if out is not None:
+                    out[:length] = self._FF_PAGE[:length]
+                    return out
                 return b'\xFF' * length
             elif status == "CORRECTED_WITH_REWRITE_RECOMMENDED":
                 print(f"정보: 페이지 {page_no}에서 ECC 오류가 수정되었으나, 해당 블록을 재기록(refresh)하는 것을 권장합니다.")
@@ -657,36 +865,16 @@ class MT29F4G08ADADA:
             # [5] (오류 수정된) 데이터 읽기
             self.set_data_pins_input()
             self._delay_ns(200)
-            GPIO.output(self.CE, GPIO.LOW)
+            self._gpio.output(self.CE, GPIO.LOW)
             self._delay_ns(50)  # CE# setup time
             
-            read_bytes = []
-            for i in range(length):
-                # 올바른 RE# 사이클 타이밍 구현
-                cycle_start = time.perf_counter_ns()
-                
-                # RE# LOW (읽기 시작)
-                GPIO.output(self.RE, GPIO.LOW)
-                self._delay_ns(self.tREA)  # RE# access time 대기
-                
-                # 데이터 읽기 (RE# LOW 상태에서)
-                byte_data = self.read_data()
-                
-                # RE# HIGH (읽기 완료)
-                GPIO.output(self.RE, GPIO.HIGH)
-                self._delay_ns(self.tREH)  # RE# high hold time
-                
-                read_bytes.append(byte_data)
-                
-                # tRC (Read Cycle Time) 준수
-                elapsed = time.perf_counter_ns() - cycle_start
-                if elapsed < self.tRR:  # tRR은 실제로 tRC와 같음
-                    self._delay_ns(self.tRR - elapsed)
+            # tRC(tRR)는 tREA + tREH + 레지스터 접근 시간으로 이미 충족됨
+            data = self._read_bytes(length, out)
 
-            GPIO.output(self.CE, GPIO.HIGH)
+            self._gpio.output(self.CE, GPIO.HIGH)
             # 읽기 후에는 finally 블록에서 출력 모드로 자동 복원됨
                 
-            return bytes(read_bytes)
+            return data
             
         except Exception as e:
             raise RuntimeError(f"페이지 읽기 실패 (페이지 {page_no}): {str(e)}")
@@ -697,30 +885,26 @@ class MT29F4G08ADADA:
         """읽기 동작 후 ECC 상태를 확인합니다. - 개선된 버전"""
         try:
             # 상태 읽기 명령
-            GPIO.output(self.CE, GPIO.LOW)
-            GPIO.output(self.CLE, GPIO.HIGH)
-            GPIO.output(self.ALE, GPIO.LOW)
+            self._gpio.output(self.CE, GPIO.LOW)
+            self._gpio.output(self.CLE, GPIO.HIGH)
+            self._gpio.output(self.ALE, GPIO.LOW)
             self._delay_ns(self.tCLS)  # CLE setup time
             
-            GPIO.output(self.WE, GPIO.LOW)
-            self._delay_ns(self.tWP)
-            self.write_data(0x70)  # Read Status command
-            GPIO.output(self.WE, GPIO.HIGH)
-            self._delay_ns(self.tWH)
+            self._emit_bytes((0x70,))  # Read Status command
             
-            GPIO.output(self.CLE, GPIO.LOW)
+            self._gpio.output(self.CLE, GPIO.LOW)
             self._delay_ns(self.tCLH)  # CLE hold time
             self._delay_ns(self.tWHR)  # WE# high to RE# low
             
             # 상태 바이트 읽기
             self.set_data_pins_input()
-            GPIO.output(self.RE, GPIO.LOW)
+            self._gpio.output(self.RE, GPIO.LOW)
             self._delay_ns(self.tREA)  # RE# access time
             status_byte = self.read_data()
-            GPIO.output(self.RE, GPIO.HIGH)
+            self._gpio.output(self.RE, GPIO.HIGH)
             self._delay_ns(self.tREH)  # RE# high hold time
             
-            GPIO.output(self.CE, GPIO.HIGH)
+            self._gpio.output(self.CE, GPIO.HIGH)
             self.set_data_pins_output()
             
             # READ MODE(00h)로 다시 전환하여 데이터 출력을 활성화해야 함
@@ -737,6 +921,49 @@ class MT29F4G08ADADA:
             print(f"상태 확인 중 오류: {str(e)}")
             return "ERROR"
     
+    def read_pages_cache(self, page_no: int, count: int, length: int = 2048) -> list:
+        """
+        READ PAGE CACHE SEQUENTIAL(31h)/LAST(3Fh)로 같은 블록 안의 연속 페이지 count개를 읽습니다.
+        이전 페이지를 캐시 레지스터에서 내보내는 동안 다음 페이지의 셀 읽기(tR)가 함께 진행됩니다.
+        페이지별 ECC 상태는 확인하지 않으므로 내장 ECC를 끈 상태에서 사용해야 합니다.
+        """
+        try:
+            last_page = page_no + count - 1
+            self.validate_page(page_no)
+            self.validate_page(last_page)
+            block_no = page_no >> self.BLOCK_SHIFT
+            if (last_page >> self.BLOCK_SHIFT) != block_no:
+                raise ValueError("연속 캐시 읽기는 한 블록 안에서만 가능합니다")
+            if self.is_bad_block(block_no):
+                raise RuntimeError(f"Bad Block({block_no}) 읽기 시도")
+
+            # [1] 첫 페이지 읽기 (00h-주소-30h)
+            self.write_command(0x00)
+            self._write_full_address(page_no, col_addr=0)
+            self.write_command(0x30)
+            self.wait_ready()
+
+            pages = []
+            for i in range(count):
+                # [2] 31h: 다음 페이지 셀 읽기 시작 + 현재 페이지를 캐시로 / 3Fh: 마지막 페이지를 캐시로
+                self.write_command(0x31 if i < count - 1 else 0x3F)
+                self.wait_ready()  # tRCBSY
+
+                # [3] 캐시 레지스터의 페이지 출력
+                self.set_data_pins_input()
+                self._delay_ns(self.tRR)
+                self._gpio.output(self.CE, GPIO.LOW)
+                pages.append(self._read_bytes(length))
+                self._gpio.output(self.CE, GPIO.HIGH)
+                self.set_data_pins_output()
+
+            return pages
+
+        except Exception as e:
+            raise RuntimeError(f"캐시 연속 읽기 실패 (페이지 {page_no}~{page_no + count - 1}): {str(e)}")
+        finally:
+            self.reset_pins()
+
     def read_page_two_plane(self, page_no1: int, page_no2: int, length: int = 2048) -> (bytes, bytes):
         """
         서로 다른 플레인에 있는 두 페이지를 동시에 읽어옵니다.
@@ -749,12 +976,12 @@ class MT29F4G08ADADA:
             # 1. 주소 및 요구 조건 유효성 검사
             self.validate_page(page_no1)
             self.validate_page(page_no2)
-            block_no1 = page_no1 // self.PAGES_PER_BLOCK
-            block_no2 = page_no2 // self.PAGES_PER_BLOCK
+            block_no1 = page_no1 >> self.BLOCK_SHIFT
+            block_no2 = page_no2 >> self.BLOCK_SHIFT
 
             if ((block_no1 >> 6) & 1) == ((block_no2 >> 6) & 1):
                 raise ValueError("두 블록이 동일한 플레인에 있습니다.")
-            if (page_no1 % self.PAGES_PER_BLOCK) != (page_no2 % self.PAGES_PER_BLOCK):
+            if (page_no1 & (self.PAGES_PER_BLOCK - 1)) != (page_no2 & (self.PAGES_PER_BLOCK - 1)):
                 raise ValueError("두 주소의 페이지 오프셋이 다릅니다.")
             if self.is_bad_block(block_no1) or self.is_bad_block(block_no2):
                 raise RuntimeError(f"Bad Block 접근 시도: 블록 {block_no1} 또는 {block_no2}")
@@ -782,10 +1009,10 @@ class MT29F4G08ADADA:
                 data2 = b'\xFF' * length
             else:
                 self.set_data_pins_input()
-                GPIO.output(self.CE, GPIO.LOW)
+                self._gpio.output(self.CE, GPIO.LOW)
                 read_bytes_2 = [self.read_data() for _ in range(length)]
                 data2 = bytes(read_bytes_2)
-                GPIO.output(self.CE, GPIO.HIGH)
+                self._gpio.output(self.CE, GPIO.HIGH)
                 self.set_data_pins_output()
 
             # [6] 플레인 변경 (이제 핀이 출력 모드이므로 안전)
@@ -801,10 +1028,10 @@ class MT29F4G08ADADA:
                 data1 = b'\xFF' * length
             else:
                 self.set_data_pins_input()
-                GPIO.output(self.CE, GPIO.LOW)
+                self._gpio.output(self.CE, GPIO.LOW)
                 read_bytes_1 = [self.read_data() for _ in range(length)]
                 data1 = bytes(read_bytes_1)
-                GPIO.output(self.CE, GPIO.HIGH)
+                self._gpio.output(self.CE, GPIO.HIGH)
 
             return data1, data2
 
@@ -813,15 +1040,17 @@ class MT29F4G08ADADA:
         finally:
             self.reset_pins()
     
-    def erase_block(self, page_no: int):
+    def erase_block(self, page_no: int, raise_on_fail: bool = True):
         """
         한 개의 블록을 지웁니다. (수정된 버전)
         내부적으로 wait_ready()를 사용하여 작업 완료를 기다립니다.
+        지우기 직후 읽은 상태 레지스터 값(bit 0 = FAIL)을 반환합니다.
+        상태가 FAIL이면 블록을 Bad Block으로 표시하고, raise_on_fail=False이면 예외 대신 상태만 반환해 호출자가 판단합니다.
         """
         try:
             # 1. 페이지 및 블록 번호 유효성 검사
             self.validate_page(page_no)
-            block_no = page_no // self.PAGES_PER_BLOCK
+            block_no = page_no >> self.BLOCK_SHIFT
             self.validate_block(block_no)
             
             # 2. 이미 알려진 Bad Block 지우기 시도 방지
@@ -840,37 +1069,57 @@ class MT29F4G08ADADA:
             self.write_command(0xD0)
             
             # [4] 작업이 완료될 때까지 대기 (tBERS)
-            self.wait_ready()
+            self.wait_ready(long_wait=True)
             
             # [5] 작업 상태 확인
-            if not self.check_operation_status():
+            status = self.read_status()
+            if status & 0x01:
                 # 지우기 실패 시, 해당 블록을 Bad Block으로 처리
                 self.mark_bad_block(block_no)
-                raise RuntimeError("블록 지우기 실패 (상태 확인)")
-                
+                if raise_on_fail:
+                    raise RuntimeError(f"블록 지우기 실패 (상태 확인: 0x{status:02X})")
+            return status
+
         except Exception as e:
             # 실패 시 블록 번호를 포함하여 예외 발생
-            block_no_for_error = page_no // self.PAGES_PER_BLOCK if 'page_no' in locals() else 'N/A'
+            block_no_for_error = page_no >> self.BLOCK_SHIFT if 'page_no' in locals() else 'N/A'
             raise RuntimeError(f"블록 지우기 실패 (블록 {block_no_for_error}): {str(e)}")
         
         finally:
             # 작업 성공/실패와 관계없이 핀 상태를 안전하게 복원
             self.reset_pins()
     
-    def erase_block_two_plane(self, page_no1: int, page_no2: int):
+    @staticmethod
+    def two_plane_pairs(blocks) -> tuple:
+        """
+        blocks(블록 번호 모음)를 플레인(BA[6] 비트)별로 나누고 같은 순번의 블록끼리 Two-plane 쌍으로 묶습니다.
+        ((plane0 블록, plane1 블록), ...) 튜플과 짝이 없어 단일로 처리할 블록 튜플을 반환합니다.
+        """
+        planes = ([], [])
+        for block in sorted(blocks):
+            planes[(block >> 6) & 1].append(block)
+        plane0_blocks, plane1_blocks = planes
+        min_len = min(len(plane0_blocks), len(plane1_blocks))
+        pairs = tuple(zip(plane0_blocks[:min_len], plane1_blocks[:min_len]))
+        return pairs, tuple(plane0_blocks[min_len:] + plane1_blocks[min_len:])
+
+    def erase_block_two_plane(self, page_no1: int, page_no2: int, raise_on_fail: bool = True):
         """
         서로 다른 플레인에 있는 두 개의 블록을 동시에 지웁니다.
         
         요구 조건:
         - 두 블록은 서로 다른 플레인에 있어야 합니다. (블록 번호의 6번째 비트가 달라야 함)
         - 두 주소의 페이지 오프셋(PA[5:0])은 동일해야 합니다.
+
+        상태 레지스터 값(bit 0 = 두 플레인 중 하나라도 FAIL)을 반환합니다.
+        raise_on_fail=False이면 FAIL 상태에서도 예외 없이 상태만 반환합니다. (타임아웃 등 다른 오류는 예외)
         """
         try:
             # 1. 두 페이지 주소 및 블록 번호 유효성 검사
             self.validate_page(page_no1)
             self.validate_page(page_no2)
-            block_no1 = page_no1 // self.PAGES_PER_BLOCK
-            block_no2 = page_no2 // self.PAGES_PER_BLOCK
+            block_no1 = page_no1 >> self.BLOCK_SHIFT
+            block_no2 = page_no2 >> self.BLOCK_SHIFT
             self.validate_block(block_no1)
             self.validate_block(block_no2)
             
@@ -880,7 +1129,7 @@ class MT29F4G08ADADA:
                 raise ValueError("두 블록이 동일한 플레인에 있습니다. Two-plane erase가 불가능합니다.")
             
             # 조건 2: 페이지 오프셋이 동일해야 함 (PA[5:0] 비교)
-            if (page_no1 % self.PAGES_PER_BLOCK) != (page_no2 % self.PAGES_PER_BLOCK):
+            if (page_no1 & (self.PAGES_PER_BLOCK - 1)) != (page_no2 & (self.PAGES_PER_BLOCK - 1)):
                 raise ValueError("두 주소의 페이지 오프셋이 다릅니다. Two-plane erase가 불가능합니다.")
 
             # --- Two-Plane Erase 시퀀스 시작 ---
@@ -898,37 +1147,40 @@ class MT29F4G08ADADA:
             self._write_row_address(page_no2)
             self.write_command(0xD0) # 두 번째 플레인 확정 및 동시 삭제 시작
             
-            # tWB 대기
-            time.sleep(0.00015)
-
-            # Ready 대기 (tBERS). 기존 erase_block과 동일한 로직 사용
-            timeout_start = time.time()
-            while GPIO.input(self.RB) == GPIO.LOW:
-                if time.time() - timeout_start > 0.020: # 20ms 타임아웃
-                    self.write_command(0xFF) # Reset
-                    time.sleep(0.001)
-                    self.wait_ready()
-                    raise RuntimeError(f"블록 삭제 타임아웃 (블록 {block_no1}, {block_no2})")
-                time.sleep(0.0002)
+            # tWB 대기 (WE# high -> R/B# low, 수백 ns)
+            self._delay_ns(self.tWB)
 
-            time.sleep(0.001)
+            # Ready 대기 (tBERS). R/B#가 HIGH가 되는 즉시 다음 블록 쌍으로 넘어갈 수 있도록
+            # 짧은 간격으로 폴링하고, 완료 후의 고정 대기는 두지 않는다.
+            # tBERS는 ms 단위이므로 상승 에지 대기 사용 (놓친 에지/에지 설정 실패 시 레벨 폴링)
+            if not self._wait_rb_high(20_000_000, edge=True): # 20ms 타임아웃
+                self.write_command(0xFF) # Reset
+                time.sleep(0.001)
+                self.wait_ready()
+                raise RuntimeError(f"블록 삭제 타임아웃 (블록 {block_no1}, {block_no2})")
 
             # 상태 확인
             # 참고: 실패 시(FAIL=1), 어떤 플레인이 실패했는지 알려면 78h(READ STATUS ENHANCED) 명령이 필요.
-            # 여기서는 간소하게 둘 중 하나라도 실패하면 에러로 처리.
-            if not self.check_operation_status():
-                raise RuntimeError("Two-plane 블록 삭제 상태 확인 실패")
+            # 여기서는 간소하게 둘 중 하나라도 실패하면 에러로 처리 (raise_on_fail=False이면 호출자가 판단).
+            status = self.read_status()
+            if status & 0x01 and raise_on_fail:
+                raise RuntimeError(f"Two-plane 블록 삭제 상태 확인 실패 (0x{status:02X})")
+            return status
 
         except Exception as e:
             raise RuntimeError(f"Two-plane 블록 삭제 실패 (블록 {block_no1}, {block_no2}): {str(e)}")
         finally:
             self.reset_pins()
-            time.sleep(0.002)
 
-    def write_full_page(self, page_no: int, data: bytes):
+    def write_full_page(self, page_no: int, data: bytes, cache: bool = False, raise_on_fail: bool = True):
         """
         한 페이지 전체(메인+스페어, 2112 바이트)를 씁니다.
         데이터가 2112 바이트보다 작으면 나머지는 0xFF로 채웁니다.
+        cache=True이면 PROGRAM PAGE CACHE(80h-15h)로 확정하여 캐시 레지스터가 비는 즉시 반환하고,
+        셀 프로그래밍(tPROG)은 다음 페이지 전송과 겹쳐 진행됩니다.
+        같은 블록의 연속 페이지를 15h로 이어 쓰고 마지막 페이지는 cache=False(10h)로 써야 합니다.
+        확정 후 읽은 상태 레지스터 값을 반환합니다. 15h 이후의 bit 1은 이전 캐시 페이지, 10h 이후의 bit 0은 이 페이지의 결과입니다.
+        raise_on_fail=False이면 FAIL 비트가 있어도 예외 없이 상태를 반환해 호출자가 페이지별로 판단합니다.
         개선된 버전
         """
         # 전체 페이지 크기 (2112 바이트) 유효성 검사
@@ -938,11 +1190,11 @@ class MT29F4G08ADADA:
         
         # 데이터가 전체 페이지 크기보다 작을 경우 0xFF로 패딩
         if len(data) < full_page_size:
-            data += b'\xFF' * (full_page_size - len(data))
+            data = self._pad_page(data, full_page_size)
 
         try:
             self.validate_page(page_no)
-            block_no = page_no // self.PAGES_PER_BLOCK
+            block_no = page_no >> self.BLOCK_SHIFT
             if self.is_bad_block(block_no):
                 raise RuntimeError(f"Bad Block({block_no})에 쓰기 시도")
             
@@ -953,38 +1205,58 @@ class MT29F4G08ADADA:
             self._write_full_address(page_no, col_addr=0)
             
             # [3] 데이터 전송 (개선된 타이밍)
+            # 주소 전송이 CE# LOW, CLE/ALE LOW 상태로 끝나므로 제어 핀은 다시 구동하지 않고 tADL만 확보
             self.set_data_pins_output()
-            GPIO.output(self.CE, GPIO.LOW)
-            GPIO.output(self.CLE, GPIO.LOW)
-            GPIO.output(self.ALE, GPIO.LOW)
-            
-            for byte_idx, byte in enumerate(data):
-                GPIO.output(self.WE, GPIO.LOW)
-                self._delay_ns(self.tWP) # WE# pulse width
-                self.write_data(byte)
-                GPIO.output(self.WE, GPIO.HIGH)
-                self._delay_ns(self.tWH) # WE# high hold time
-                
-                # 매 256바이트마다 짧은 대기 (버퍼링 고려)
-                #if (byte_idx + 1) % 256 == 0:
-                #    self._delay_ns(1000)  # 1us 대기
-                self._delay_ns(50)
+            self._delay_ns(self.tADL)
+            
+            self._emit_bytes(data)
+
+            if cache:
+                # [4] 캐시 쓰기 확정 명령 (15h) - R/B#는 캐시 레지스터가 비면(tCBSY) Ready
+                self.write_command(0x15)
+                self.wait_ready()
+
+                # [5] 캐시 동작 중에는 이전 페이지의 결과가 bit 1에 보고됨
+                status = self.read_status()
+                if status & 0x02 and raise_on_fail:
+                    raise RuntimeError(f"이전 페이지 캐시 쓰기 실패 (상태: 0x{status:02X})")
+                return status
 
             # [4] 쓰기 확정 명령 (10h)
             self.write_command(0x10)
             
             # [5] tPROG_ECC 대기
-            self.wait_ready()
+            self.wait_ready(long_wait=True)
             
-            # [6] 상태 확인
-            if not self.check_operation_status():
+            # [6] 상태 확인 (캐시 체인의 마지막 페이지이면 bit 1은 이전 페이지의 결과)
+            status = self.read_status()
+            if status & 0x01 and raise_on_fail:
                 # self.mark_bad_block(block_no) # Bad block 없다고 가정하므로 주석 처리하거나 제거
-                raise RuntimeError("페이지 쓰기 실패 (상태 확인)")
+                raise RuntimeError(f"페이지 쓰기 실패 (상태 확인: 0x{status:02X})")
+            return status
                 
         except Exception as e:
             raise RuntimeError(f"페이지 쓰기 실패 (페이지 {page_no}): {str(e)}")
         finally:
             self.reset_pins()
+
+    def finish_cache_program(self, timeout_ns: int = 20_000_000) -> int:
+        """
+        캐시 프로그램(15h) 체인을 10h 페이지로 끝내지 못했을 때(전송 중 오류 등) 진행 중인 프로그램이 끝날 때까지 기다립니다.
+        15h 이후 R/B#는 캐시 레지스터가 비면 Ready가 되므로, 상태 레지스터의 ARDY(bit 5)가 설정될 때까지 폴링합니다.
+        마지막으로 읽은 상태 값을 반환합니다.
+        """
+        try:
+            self.wait_ready()
+            deadline = time.perf_counter_ns() + timeout_ns
+            while True:
+                status = self.read_status()
+                if status & 0x20:  # ARDY: 배열 동작 완료
+                    return status
+                if time.perf_counter_ns() > deadline:
+                    raise RuntimeError(f"캐시 프로그램 종료 대기 타임아웃 (상태: 0x{status:02X})")
+        finally:
+            self.reset_pins()
     
     def check_ecc_status(self):
         """GET FEATURES(EEh) 명령을 사용해 칩의 현재 ECC 설정 상태를 읽고 출력합니다."""
@@ -1000,14 +1272,14 @@ class MT29F4G08ADADA:
 
             # 결과 파라미터 읽기
             self.set_data_pins_input()
-            GPIO.output(self.CE, GPIO.LOW)
+            self._gpio.output(self.CE, GPIO.LOW)
             
             params = []
             for _ in range(4):
-                GPIO.output(self.RE, GPIO.LOW)
+                self._gpio.output(self.RE, GPIO.LOW)
                 self._delay_ns(self.tREA)
                 byte_data = self.read_data()
-                GPIO.output(self.RE, GPIO.HIGH)
+                self._gpio.output(self.RE, GPIO.HIGH)
                 self._delay_ns(self.tREH)
                 params.append(byte_data)
             
@@ -1029,8 +1301,8 @@ class MT29F4G08ADADA:
         4Gb 모델(MT29F4G)의 데이터시트(Table 2) 사양에 맞게 
         5바이트 전체 주소(컬럼+로우)를 조합하여 전송합니다.
         """
-        page_in_block = page_no % self.PAGES_PER_BLOCK
-        block_no = page_no // self.PAGES_PER_BLOCK
+        page_in_block = page_no & (self.PAGES_PER_BLOCK - 1)
+        block_no = page_no >> self.BLOCK_SHIFT
 
         # 4096개 블록은 12비트(0~11)로 표현됩니다. (2^12 = 4096)
         # 데이터시트는 이 12개 비트를 BA6 ~ BA17로 매핑합니다.
@@ -1056,20 +1328,15 @@ class MT29F4G08ADADA:
         addresses[4] = (block_no >> 10) & 0x03
 
         # 생성된 5바이트 주소를 전송
-        GPIO.output(self.CE, GPIO.LOW)
+        self._gpio.output(self.CE, GPIO.LOW)
         self._delay_ns(50)
-        GPIO.output(self.CLE, GPIO.LOW)
-        GPIO.output(self.ALE, GPIO.HIGH)
+        self._gpio.output(self.CLE, GPIO.LOW)
+        self._gpio.output(self.ALE, GPIO.HIGH)
         self._delay_ns(self.tALS)
 
-        for addr_byte in addresses:
-            GPIO.output(self.WE, GPIO.LOW)
-            self._delay_ns(self.tWP)
-            self.write_data(addr_byte)
-            GPIO.output(self.WE, GPIO.HIGH)
-            self._delay_ns(self.tWH)
+        self._emit_bytes(addresses)
             
-        GPIO.output(self.ALE, GPIO.LOW)
+        self._gpio.output(self.ALE, GPIO.LOW)
         self._delay_ns(self.tALH)
 
     def _write_row_address(self, page_no: int):
@@ -1077,8 +1344,8 @@ class MT29F4G08ADADA:
         4Gb 모델(MT29F4G)의 데이터시트(Table 2) 사양에 맞게 
         3바이트 Row Address(블록+페이지)를 조합하여 전송합니다.
         """
-        page_in_block = page_no % self.PAGES_PER_BLOCK
-        block_no = page_no // self.PAGES_PER_BLOCK
+        page_in_block = page_no & (self.PAGES_PER_BLOCK - 1)
+        block_no = page_no >> self.BLOCK_SHIFT
 
         row_addresses = [
             # Cycle 3: {BA7, BA6, PA5:PA0}
@@ -1091,18 +1358,13 @@ class MT29F4G08ADADA:
         ]
 
         # 생성된 주소를 전송
-        GPIO.output(self.CE, GPIO.LOW)
+        self._gpio.output(self.CE, GPIO.LOW)
         self._delay_ns(50)
-        GPIO.output(self.CLE, GPIO.LOW)
-        GPIO.output(self.ALE, GPIO.HIGH)
+        self._gpio.output(self.CLE, GPIO.LOW)
+        self._gpio.output(self.ALE, GPIO.HIGH)
         self._delay_ns(self.tALS)
 
-        for addr_byte in row_addresses:
-            GPIO.output(self.WE, GPIO.LOW)
-            self._delay_ns(self.tWP)
-            self.write_data(addr_byte)
-            GPIO.output(self.WE, GPIO.HIGH)
-            self._delay_ns(self.tWH)
+        self._emit_bytes(row_addresses)
             
-        GPIO.output(self.ALE, GPIO.LOW)
+        self._gpio.output(self.ALE, GPIO.LOW)
         self._delay_ns(self.tALH)
\ No newline at end of file
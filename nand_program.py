@@ -1,5 +1,10 @@
+import argparse
+import functools
+import mmap
 import os
+import queue
 import sys
+import threading
 from datetime import datetime
 from nand_driver import MT29F4G08ADADA
 import time
@@ -7,66 +12,159 @@ import time
 # --- 새로운 상수 정의 ---
 FULL_PAGE_SIZE = MT29F4G08ADADA.PAGE_SIZE + MT29F4G08ADADA.SPARE_SIZE # 2112 바이트
 #PAGE_SIZE = MT29F4G08ADADA.PAGE_SIZE
+PREFETCH_DEPTH = 8  # NAND 작업 중에 미리 읽어 둘 분할 파일 수
+PROGRESS_INTERVAL = 0.25  # 진행률 표시 갱신 간격 (초)
+IO_DEPTH = 8  # 먼저 연속으로 쓰고 나서 한꺼번에 검증할 페이지 수
+OPEN_NOATIME = getattr(os, 'O_NOATIME', 0)  # 분할 파일 읽기 시 atime 갱신 생략 (Linux)
 
-def hex_to_int(hex_str: str) -> int:
-    """16진수 문자열을 정수로 변환"""
+def address_sort_key(name: str) -> tuple:
+    """
+    분할 파일을 파일명(16진수 시작 주소)의 수치 순서로 정렬하기 위한 키.
+    자릿수가 다른 파일명이 섞여도 페이지 번호 순서(같은 블록의 페이지가 연속)가 되어
+    캐시 프로그램(15h) 연결이 끊기지 않습니다. 주소로 해석되지 않는 파일명은 맨 뒤로 보냅니다.
+    """
     try:
-        return int(hex_str, 16)
+        return (0, int(name[:-4], 16), name)
     except ValueError:
-        raise ValueError(f"잘못된 파일명 형식: {hex_str}")
-
-def calculate_page_number(address: int) -> int:
-    """주소를 페이지 번호로 변환"""
-    page_no = address // FULL_PAGE_SIZE # 주소 계산의 기준을 전체 페이지 크기로 변경
-    if page_no >= 4096 * 64: # <<< 8192에서 4096으로 변경
-        raise ValueError(f"유효하지 않은 페이지 번호: {page_no}")
-    return page_no
+        return (1, 0, name)
 
 def validate_directory(dirpath: str) -> None:
     """디렉토리 유효성 검사"""
-    if not os.path.exists(dirpath) or not os.path.isdir(dirpath):
+    if not os.path.isdir(dirpath):  # 없는 경로도 False (stat 한 번)
         raise NotADirectoryError(f"유효한 디렉토리가 아님: {dirpath}")
 
+RT_PRIORITY = 50  # 메인(NAND 제어) 스레드의 SCHED_FIFO 우선순위
+
+_saved_scheduling = None  # 실시간 스케줄링 적용 전 (정책, 파라미터, CPU 집합)
+
+def enable_realtime_scheduling() -> bool:
+    """
+    호출한 스레드를 CPU 하나에 고정하고 SCHED_FIFO로 올려 짧은 sleep/지연이 요청한 만큼만 걸리게 합니다.
+    적용 전 정책/우선순위/CPU 집합을 저장해 두며, 작업이 끝나면 restore_scheduling()으로 되돌려야 합니다.
+    CAP_SYS_NICE(root)가 없거나 지원하지 않는 OS이면 아무것도 바꾸지 않고 False를 반환합니다.
+    """
+    global _saved_scheduling
+    if not hasattr(os, 'sched_setscheduler'):
+        return False
+    try:
+        saved = (os.sched_getscheduler(0), os.sched_getparam(0), os.sched_getaffinity(0))
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(RT_PRIORITY))
+    except OSError:
+        return False
+    _saved_scheduling = saved
+    cpus = saved[2]
+    if len(cpus) > 1:
+        try:
+            os.sched_setaffinity(0, {max(cpus)})  # 보통 0번 코어에 몰리는 IRQ를 피해 마지막 코어 사용
+        except OSError:
+            pass  # CPU 고정 없이 FIFO만 적용 (복원은 동일)
+    return True
+
+def drop_realtime_scheduling() -> None:
+    """
+    enable_realtime_scheduling() 이후 생성된 스레드는 FIFO 우선순위와 CPU 고정을 상속하므로,
+    보조 스레드 시작 시 호출하여 적용 전의 스케줄링 정책과 CPU 집합으로 되돌립니다.
+    """
+    saved = _saved_scheduling
+    if saved is None:
+        return
+    policy, param, cpus = saved
+    try:
+        os.sched_setscheduler(0, policy, param)
+        os.sched_setaffinity(0, cpus)
+    except OSError:
+        pass
+
+def restore_scheduling() -> None:
+    """enable_realtime_scheduling()을 호출한 스레드의 스케줄링 정책과 CPU 집합을 원래대로 되돌립니다."""
+    global _saved_scheduling
+    drop_realtime_scheduling()
+    _saved_scheduling = None
+
+def prefetch_files(entries: list, depth: int = PREFETCH_DEPTH, held: int = IO_DEPTH):
+    """
+    백그라운드 스레드가 파일을 최대 depth개 앞서 읽어 두고, (entry, data)를 entries 순서대로 내보냅니다.
+    NAND가 tPROG/tR로 바쁜 동안 파일 읽기가 끝나 있으므로 메인 루프는 파일 I/O를 기다리지 않습니다.
+    파일마다 새 bytes를 만들지 않고 미리 할당한 페이지 버퍼에 readinto하며, data는 그 버퍼의 memoryview입니다.
+    버퍼는 순환 재사용되므로 호출자는 한 번에 최대 held개(쓰기 배치)까지만 data를 보관해야 합니다.
+    읽기 중 발생한 예외는 data 자리에 예외 객체로 전달됩니다.
+    생성기를 닫으면(close(), 호출자가 중단된 경우) 읽기 스레드에 중지를 알리고 끝날 때까지 join합니다.
+    """
+    pending = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    # 동시에 살아 있을 수 있는 버퍼: 호출자 보관(held) + 큐(depth) + 읽는 중(1) + 여유(1)
+    pool = [bytearray(FULL_PAGE_SIZE) for _ in range(depth + held + 2)]
+
+    def reader():
+        drop_realtime_scheduling()  # 메인 스레드와 같은 코어에서 FIFO로 경쟁하지 않도록
+        for index, entry in enumerate(entries):
+            if stop.is_set():
+                return
+            buf = pool[index % len(pool)]
+            try:
+                # 파이썬 io 스택을 거치지 않고 open/readv/close 시스템 호출만 사용
+                try:
+                    fd = os.open(entry.path, os.O_RDONLY | OPEN_NOATIME)
+                except PermissionError:
+                    fd = os.open(entry.path, os.O_RDONLY)  # O_NOATIME은 파일 소유자만 사용 가능
+                try:
+                    n = os.readv(fd, [buf])
+                    if n == FULL_PAGE_SIZE and os.read(fd, 1):
+                        raise ValueError(f"파일 크기가 전체 페이지 크기({FULL_PAGE_SIZE} bytes)를 초과합니다.")
+                finally:
+                    os.close(fd)
+                data = memoryview(buf)[:n]
+            except Exception as e:
+                data = e
+            # 소비자가 멈춘 경우 put에서 영원히 막히지 않도록 중지 요청을 주기적으로 확인
+            while not stop.is_set():
+                try:
+                    pending.put((entry, data), timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
+        for _ in range(len(entries)):
+            yield pending.get()
+    finally:
+        stop.set()
+        thread.join()
+
+def scan_image_pages(image: mmap.mmap) -> list:
+    """
+    원본 이미지(Bin1_page_split.py의 input.bin)에서 0xFF로만 채워지지 않은 페이지의 시작 오프셋 목록을 반환합니다.
+    분할 파일을 만들지 않고 이미지 한 개를 mmap한 채로 페이지를 잘라 쓰기 위한 것으로,
+    건너뛰는 페이지와 순서는 Bin1_page_split.py와 같습니다.
+    """
+    all_ff = b'\xff' * FULL_PAGE_SIZE
+    return [offset for offset in range(0, len(image), FULL_PAGE_SIZE)
+            if image[offset:offset + FULL_PAGE_SIZE] != all_ff]
+
+@functools.lru_cache(maxsize=4)
 def get_two_plane_pairs(total_blocks: int) -> tuple:
-    """전체 블록에서 Two-plane 삭제 가능한 블록 쌍을 생성합니다."""
-    pairs = []
-    
-    # 플레인별로 블록을 분류 (BA[6] 비트 기준)
-    plane0_blocks = []  # BA[6] = 0
-    plane1_blocks = []  # BA[6] = 1
-    
-    for block in range(total_blocks):
-        if (block >> 6) & 1 == 0:  # BA[6] = 0
-            plane0_blocks.append(block)
-        else:  # BA[6] = 1
-            plane1_blocks.append(block)
-    
-    # 각 플레인에서 동일한 인덱스의 블록들을 쌍으로 만들기
-    min_plane_size = min(len(plane0_blocks), len(plane1_blocks))
-    
-    for i in range(min_plane_size):
-        pairs.append((plane0_blocks[i], plane1_blocks[i]))
-    
-    # 남은 블록들은 단일 블록으로 처리
-    remaining_blocks = []
-    if len(plane0_blocks) > min_plane_size:
-        remaining_blocks.extend(plane0_blocks[min_plane_size:])
-    if len(plane1_blocks) > min_plane_size:
-        remaining_blocks.extend(plane1_blocks[min_plane_size:])
-    
-    return pairs, remaining_blocks
+    """전체 블록에서 Two-plane 삭제 가능한 블록 쌍을 생성합니다. (total_blocks별로 캐시됨)"""
+    return MT29F4G08ADADA.two_plane_pairs(range(total_blocks))
 
-def erase_all_blocks_fast(nand):
-    """검증 없이 모든 블록을 빠르게 초기화합니다 (Two-plane 기능 사용)"""
+def erase_all_blocks_fast(nand, blocks=None):
+    """
+    검증 없이 모든 블록을 빠르게 초기화합니다 (Two-plane 기능 사용)
+    blocks(블록 번호 모음)를 주면 전체 대신 해당 블록만 삭제합니다.
+    """
     TOTAL_BLOCKS = 4096 # <<< 8192에서 4096으로 변경
     PAGES_PER_BLOCK = 64
     
     try:
         start_datetime = datetime.now()
-        print(f".=== 전체 블록 빠른 초기화 시작 (검증 없음) ===")
+        if blocks is None:
+            print(f".=== 전체 블록 빠른 초기화 시작 (검증 없음) ===")
+        else:
+            print(f".=== 사용 블록 빠른 초기화 시작 (검증 없음) ===")
         print(f"시작 시간: {start_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"총 블록 수: {TOTAL_BLOCKS}개")
-        print("주의: 이 과정은 모든 데이터를 삭제하며 검증하지 않습니다.")
+        print(f"총 블록 수: {TOTAL_BLOCKS if blocks is None else len(blocks)}개")
+        print("주의: 이 과정은 대상 블록의 모든 데이터를 삭제하며 검증하지 않습니다.")
         
         # Bad Block 테이블 초기화
         nand.bad_blocks = set()
@@ -74,7 +172,10 @@ def erase_all_blocks_fast(nand):
         successful_blocks_erase = []
         failed_blocks_erase = []
         
-        block_pairs, remaining_blocks = get_two_plane_pairs(TOTAL_BLOCKS)
+        if blocks is None:
+            block_pairs, remaining_blocks = get_two_plane_pairs(TOTAL_BLOCKS)
+        else:
+            block_pairs, remaining_blocks = MT29F4G08ADADA.two_plane_pairs(blocks)
         
         # 1. Two-plane으로 블록 쌍 삭제
         print("Two-plane 블록 삭제 진행 중...")
@@ -139,6 +240,14 @@ def erase_all_blocks_fast(nand):
         print(f"\n전체 블록 초기화 중 오류 발생: {str(e)}")
         return False
 
+def retry_backoff(retry: int) -> None:
+    """
+    retry번째 실패 후 대기. 첫 재시도는 바로 수행하고, 이후 1ms, 10ms, 100ms... 로 늘립니다.
+    (NAND 쓰기/검증 실패는 대부분 일시적 지연이 아니라 즉시 재시도로 판별되므로 고정 1초 대기는 불필요)
+    """
+    if retry >= 1:
+        time.sleep(0.001 * 10 ** (retry - 1))
+
 def program_page_only(nand, page_no: int, write_data: bytes, max_retries: int = 5) -> bool:
     """페이지 쓰기 수행 (Bad Block 로직 제거)"""
     for retry in range(max_retries):
@@ -152,29 +261,187 @@ def program_page_only(nand, page_no: int, write_data: bytes, max_retries: int =
                 raise RuntimeError(f"페이지 {page_no} 쓰기 최종 실패: {str(e)}")
             else:
                 print(f"    쓰기 재시도 {retry + 1}/{max_retries}: {str(e)}")
-                time.sleep(1) # 1초 대기
+                retry_backoff(retry)
     return False
 
-def verify_pages_batch(nand, page_data_list: list, max_retries: int = 5) -> dict:
+# ECC 영역 정의 (16진수 주소를 10진수로 변환) - 내장 ECC가 켜진 Block 0에서는 칩이 직접 값을 기록하므로 비교에서 제외
+ECC_RANGES = [
+    (0x808, 0x80F),  # 808h-80Fh
+    (0x818, 0x81F),  # 818h-81Fh  
+    (0x828, 0x82F),  # 828h-82Fh
+    (0x838, 0x83F),  # 838h-83Fh
+]
+
+def compare_segments(length):
+    """[0, length)에서 ECC 영역을 뺀 비교 구간 [start, end) 목록"""
+    segments = []
+    pos = 0
+    for start, end in ECC_RANGES:
+        if start >= length:
+            break
+        if pos < start:
+            segments.append((pos, start))
+        pos = end + 1
+    if pos < length:
+        segments.append((pos, length))
+    return segments
+
+def find_mismatches(original_data, read_data, segments, limit=16):
+    """
+    비교 구간에서 불일치 내역을 최대 limit개까지 찾습니다.
+    64바이트 조각을 슬라이스 비교(C 수준)로 먼저 확인하고, 다른 조각만 바이트 단위로 살펴봅니다.
+    """
+    mismatches = []
+    for seg_start, seg_end in segments:
+        for base in range(seg_start, seg_end, 64):
+            stop = min(base + 64, seg_end)
+            if original_data[base:stop] == read_data[base:stop]:
+                continue
+            for i in range(base, stop):
+                written_byte = original_data[i]
+                read_byte = read_data[i]
+                if written_byte != read_byte:
+                    mismatches.append(
+                        f"  - 오프셋 0x{i:04X}: 쓰기=0x{written_byte:02X}, 읽기=0x{read_byte:02X}"
+                    )
+                    if len(mismatches) >= limit:
+                        mismatches.append("  - ... (불일치 다수)")
+                        return mismatches
+    return mismatches
+
+def matches_except_ecc(original_data, read_data) -> bool:
+    """전체 비교(==) 한 번으로 먼저 확인하고, 다르면 ECC 영역을 뺀 구간만 비교합니다. (verify_pages_batch와 같은 기준)"""
+    if read_data == original_data:
+        return True
+    compare_len = min(len(original_data), len(read_data))
+    return all(original_data[start:end] == read_data[start:end] for start, end in compare_segments(compare_len))
+
+def program_and_verify_batch(nand, batch: list, use_cache: bool, max_retries: int = 5, verify: bool = True,
+                             skip_matching: bool = False) -> tuple:
+    """
+    batch(page_info 목록)의 페이지를 먼저 모두 쓴 뒤 한꺼번에 읽어 검증합니다.
+    use_cache이면 같은 블록 안에서 바로 다음 페이지가 이어지는 경우 PROGRAM PAGE CACHE(15h)로 확정하여
+    이전 페이지의 tPROG와 다음 페이지 데이터 전송을 겹칩니다. 체인의 마지막 페이지는 항상 10h로 씁니다.
+    15h 이후 상태의 bit 1은 직전 캐시 페이지, 체인을 끝내는 10h 이후 bit 0은 마지막 페이지의 결과로 기록하며,
+    체인 안의 페이지는 이미 배열에 확정되었을 수 있으므로 다시 쓰지 않습니다.
+    쓰기 도중 예외가 나면 진행 중인 프로그램을 상태 대기로 끝내고 해당 페이지들은 읽기 검증으로 판정합니다.
+    verify=False이면 읽기 검증 없이 페이지별 프로그램 상태(PASS/FAIL)만 신뢰합니다.
+    이 경우 이전 페이지의 실패가 다음 페이지 상태로 보고되는 캐시 쓰기는 사용하지 않습니다.
+    skip_matching이면 쓰기 전에 페이지를 읽어 이미 같은 데이터인 페이지(ECC 영역 제외)는 쓰기/검증 없이 성공으로 셉니다.
+    다른 데이터가 들어 있고 지워지지도 않은 페이지는 삭제 없이 쓸 수 없으므로 쓰지 않고 "블록 삭제 필요"로 실패 처리합니다.
+    (성공 페이지 수, 실패 내역 [{'file', 'reason'}]) 를 반환합니다.
+    """
+    failures = []
+    written = []
+    skipped = 0
+    if skip_matching:
+        pending = []
+        for page_info in batch:
+            page_no = page_info['page_no']
+            try:
+                read_data = nand.read_page(page_no, len(page_info['data']))
+            except Exception:
+                pending.append(page_info)  # 읽기 실패 시 평소대로 쓴다
+                continue
+            if matches_except_ecc(page_info['data'], read_data):
+                skipped += 1
+                continue
+            if read_data.lstrip(b'\xff'):
+                # 지워지지 않은 페이지는 0 -> 1로 되돌릴 수 없어 다시 써도 검증이 실패하므로 쓰지 않고 실패로 기록
+                failures.append({'file': page_info['filename'],
+                                 'reason': f"페이지 {page_no}에 다른 데이터가 이미 기록됨 - 블록 {page_no >> nand.BLOCK_SHIFT} 삭제 후 다시 써야 함 (--skip-matching은 삭제하지 않음)"})
+                continue
+            pending.append(page_info)
+        batch = pending
+
+    chain_prev = None  # 15h로 확정했지만 결과(다음 상태의 bit 1)를 아직 받지 못한 페이지
+    for i, page_info in enumerate(batch):
+        page_no = page_info['page_no']
+        next_info = batch[i + 1] if i + 1 < len(batch) else None
+        cache = (verify and use_cache and next_info is not None
+                 and next_info['page_no'] == page_no + 1
+                 and next_info['page_no'] % nand.PAGES_PER_BLOCK != 0)
+        if not cache and chain_prev is None:
+            # 캐시 체인 밖의 페이지: 일반 쓰기(10h) + 재시도
+            try:
+                program_page_only(nand, page_no, page_info['data'], max_retries)
+                written.append(page_info)
+            except Exception as e:
+                failures.append({'file': page_info['filename'], 'reason': str(e)})
+            continue
+
+        # 캐시 체인 안의 페이지는 다시 쓰지 않음 (15h/10h 이후에는 이미 배열에 확정되어 재프로그램 불가)
+        try:
+            status = nand.write_full_page(page_no, page_info['data'], cache=cache, raise_on_fail=False)
+        except Exception as e:
+            # 체인을 상태 대기로 끝내고, 확정 여부를 알 수 없는 페이지는 읽기 검증으로 판정
+            print(f"\n    캐시 쓰기 오류 (페이지 {page_no}): {str(e)}")
+            try:
+                nand.finish_cache_program()
+            except Exception as finish_error:
+                print(f"    캐시 프로그램 종료 대기 실패: {str(finish_error)}")
+            if chain_prev is not None:
+                written.append(chain_prev)
+            written.append(page_info)
+            chain_prev = None
+            continue
+
+        # 상태 bit 1은 직전 캐시 페이지의 결과
+        if chain_prev is not None:
+            if status & 0x02:
+                failures.append({'file': chain_prev['filename'], 'reason': f"캐시 쓰기 실패 (상태: 0x{status:02X})"})
+            else:
+                written.append(chain_prev)
+        if cache:
+            chain_prev = page_info  # 결과는 다음 페이지의 상태로 보고됨
+        else:
+            # 체인을 끝낸 10h: bit 0이 이 페이지의 결과
+            chain_prev = None
+            if status & 0x01:
+                failures.append({'file': page_info['filename'], 'reason': f"페이지 쓰기 실패 (상태: 0x{status:02X})"})
+            else:
+                written.append(page_info)
+
+    if not verify:
+        return skipped + len(written), failures
+
+    # 마지막 쓰기가 10h로 끝났으므로 배열이 Ready인 상태에서 읽기 검증
+    verification_results = verify_pages_batch(nand, written, max_retries, use_cache_read=use_cache)
+    for failed_info in verification_results['failed']:
+        failures.append({'file': failed_info['filename'], 'reason': failed_info['error']})
+    return skipped + len(verification_results['success']), failures
+
+def verify_pages_batch(nand, page_data_list: list, max_retries: int = 5, use_cache_read: bool = False) -> dict:
     """
     배치로 페이지들을 검증합니다. (ECC 영역 제외)
     ECC 영역: 808h-80Fh, 818h-81Fh, 828h-82Fh, 838h-83Fh
+    use_cache_read이면 같은 블록의 연속 페이지를 캐시 연속 읽기(31h/3Fh)로 한 번에 미리 읽습니다.
+    (페이지별 ECC 상태를 보지 않으므로 내장 ECC가 꺼진 블록에서만 사용)
     """
-    # ECC 영역 정의 (16진수 주소를 10진수로 변환)
-    ECC_RANGES = [
-        (0x808, 0x80F),  # 808h-80Fh
-        (0x818, 0x81F),  # 818h-81Fh  
-        (0x828, 0x82F),  # 828h-82Fh
-        (0x838, 0x83F),  # 838h-83Fh
-    ]
-    
-    def is_ecc_offset(offset):
-        """주어진 오프셋이 ECC 영역인지 확인"""
-        for start, end in ECC_RANGES:
-            if start <= offset <= end:
-                return True
-        return False
-    
+    # 연속 페이지 구간을 캐시 연속 읽기로 미리 읽어 둔다 (실패하면 아래에서 페이지별로 읽음)
+    prefetched = {}
+    if use_cache_read:
+        runs = []
+        for page_info in sorted(page_data_list, key=lambda info: info['page_no']):
+            page_no = page_info['page_no']
+            if runs and page_no == runs[-1][-1]['page_no'] + 1 and page_no % nand.PAGES_PER_BLOCK != 0:
+                runs[-1].append(page_info)
+            else:
+                runs.append([page_info])
+        for run in runs:
+            if len(run) < 2:
+                continue
+            try:
+                length = max(len(info['data']) for info in run)
+                pages = nand.read_pages_cache(run[0]['page_no'], len(run), length)
+            except Exception:
+                continue
+            for info, data in zip(run, pages):
+                prefetched[info['page_no']] = data[:len(info['data'])]
+
+    # 페이지별로 읽을 때는 배치 전체에서 버퍼 하나를 재사용 (페이지마다 bytes 할당 방지)
+    read_buf = memoryview(bytearray(FULL_PAGE_SIZE))
+
     results = {'success': [], 'failed': []}
     for page_info in page_data_list:
         page_no = page_info['page_no']
@@ -182,29 +449,21 @@ def verify_pages_batch(nand, page_data_list: list, max_retries: int = 5) -> dict
         
         for retry in range(max_retries):
             try:
-                # 페이지 전체를 읽어옵니다.
-                read_data = nand.read_page(page_no, len(original_data))
+                # 페이지 전체를 읽어옵니다. (첫 시도는 미리 읽은 데이터 사용, 재시도는 다시 읽음)
+                read_data = prefetched.pop(page_no, None)
+                if read_data is None:
+                    read_data = nand.read_page(page_no, len(original_data), out=read_buf[:len(original_data)])
                 
-                # ECC 영역을 제외한 데이터 비교
-                mismatches = []
+                # 전체가 같으면 (대부분의 페이지) C 수준 비교 한 번으로 통과
+                if read_data == original_data:
+                    results['success'].append(page_info)
+                    break
+
+                # ECC 영역을 제외한 데이터 비교 (불일치가 있을 때만 바이트 단위로 확인)
                 compare_len = min(len(original_data), len(read_data))
-                ecc_skipped_count = 0
-                
-                for i in range(compare_len):
-                    # ECC 영역은 건너뛰기
-                    if is_ecc_offset(i):
-                        ecc_skipped_count += 1
-                        continue
-                        
-                    written_byte = original_data[i]
-                    read_byte = read_data[i]
-                    if written_byte != read_byte:
-                        mismatches.append(
-                            f"  - 오프셋 0x{i:04X}: 쓰기=0x{written_byte:02X}, 읽기=0x{read_byte:02X}"
-                        )
-                        if len(mismatches) >= 16:
-                            mismatches.append("  - ... (불일치 다수)")
-                            break
+                segments = compare_segments(compare_len)
+                ecc_skipped_count = compare_len - sum(end - start for start, end in segments)
+                mismatches = find_mismatches(original_data, read_data, segments)
                 
                 # 불일치가 있으면 오류 발생
                 if mismatches:
@@ -223,15 +482,35 @@ def verify_pages_batch(nand, page_data_list: list, max_retries: int = 5) -> dict
                     results['failed'].append(page_info)
                 else:
                     print(f"    검증 재시도 {retry + 1}/{max_retries} (페이지 {page_no}): {str(e)}")
-                    time.sleep(1)
+                    retry_backoff(retry)
                     
     return results
 
-def program_nand(initialize_blocks: bool = False):
-    """NAND 플래시 프로그래밍 (Block 0는 ECC 활성화, 나머지는 비활성화)"""
+def program_nand(initialize_blocks: bool = False, image_path: str = None, verify: bool = True,
+                 skip_matching: bool = False, erase_touched_only: bool = False, nand=None):
+    """
+    NAND 플래시 프로그래밍 (Block 0는 ECC 활성화, 나머지는 비활성화)
+    image_path를 주면 output_splits 대신 원본 이미지 하나를 mmap하여 페이지를 잘라 씁니다.
+    verify=False이면 쓰기 후 읽기 검증을 생략하고 프로그램 상태 레지스터 결과만 확인합니다.
+    skip_matching=True이면 이미 같은 데이터가 들어 있는 페이지는 다시 쓰지 않습니다 (중단 후 재실행용).
+    이때 지워지지 않은 채 다른 데이터가 들어 있는 페이지는 쓰지 않고 블록 삭제가 필요하다는 실패로 기록합니다.
+    erase_touched_only=True이면 초기화 시 전체 블록 대신 쓸 페이지가 있는 블록만 삭제합니다.
+    nand에 이미 초기화된 드라이버를 주면 새로 만들지 않고 그대로 사용합니다 (정리는 호출자 몫).
+    """
+    image = None
+    prefetch = None
+    realtime = False
+    owns_nand = nand is None
     try:
-        print("NAND 플래시 드라이버 초기화 중...")
-        nand = MT29F4G08ADADA()
+        if owns_nand:
+            print("NAND 플래시 드라이버 초기화 중...")
+            nand = MT29F4G08ADADA()
+
+        realtime = enable_realtime_scheduling()
+        if realtime:
+            print("실시간 스케줄링(SCHED_FIFO) 및 CPU 고정 적용")
+        else:
+            print("참고: 실시간 스케줄링 권한이 없어 기본 스케줄러로 진행합니다 (root로 실행 시 적용).")
         
         # --- 👇 여기부터 수정 ---
 
@@ -245,25 +524,65 @@ def program_nand(initialize_blocks: bool = False):
 
         nand.check_ecc_status()
 
-        # 2. 전체 블록 초기화 (ECC 비활성화 상태에서 진행)
+        if image_path:
+            # 이미지 모드: 파일 하나를 한 번만 열고 mmap 슬라이스로 페이지 데이터를 얻는다
+            with open(image_path, 'rb') as f:
+                image = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            offsets = scan_image_pages(image)
+            if not offsets:
+                raise ValueError(f"프로그래밍할 페이지가 없음: {image_path}")
+            # 마지막 페이지가 짧으면 Bin1_page_split.py와 같이 0x00으로 채움
+            names = [f"{offset:08X}.bin" for offset in offsets]
+            page_sources = (image[offset:offset + FULL_PAGE_SIZE].ljust(FULL_PAGE_SIZE, b'\x00') for offset in offsets)
+        else:
+            splits_dir = "output_splits"
+            validate_directory(splits_dir)
+
+            # 디렉토리를 한 번만 훑어 DirEntry(이름/경로/stat 캐시)를 얻는다
+            with os.scandir(splits_dir) as it:
+                entries = sorted((e for e in it if e.name.endswith('.bin')), key=lambda e: address_sort_key(e.name))
+            if not entries:
+                raise ValueError(f"프로그래밍할 파일이 없음: {splits_dir}")
+            names = [e.name for e in entries]
+            prefetch = prefetch_files(entries)
+            page_sources = (data for _, data in prefetch)
+        
+        total_files = len(names)
+        failed_files_info = []
+
+        # 파일명(시작 주소) → 페이지 번호를 루프 전에 한 번에 계산하고 범위를 검증
+        total_pages = nand.TOTAL_BLOCKS * nand.PAGES_PER_BLOCK
+        page_numbers = []
+        for name in names:
+            try:
+                page_numbers.append(int(name[:-4], 16) // FULL_PAGE_SIZE)
+            except ValueError:
+                page_numbers.append(None)  # 루프에서 파일 처리 오류로 기록
+        # 범위를 벗어난 파일은 전체 작업을 멈추지 않고 루프에서 실패로 기록한 뒤 건너뜀
+        out_of_range = {index for index, p in enumerate(page_numbers) if p is not None and p >= total_pages}
+        if out_of_range:
+            print(f"경고: 장치 범위를 벗어난 주소의 파일 {len(out_of_range)}개는 실패로 기록하고 건너뜁니다.")
+
+        # 2. 블록 초기화 (ECC 비활성화 상태에서 진행)
+        # erase_touched_only이면 쓸 페이지가 있는 블록만 지운다 (나머지 블록의 기존 데이터는 유지)
         if initialize_blocks:
-            print("\n전체 블록 초기화를 시작합니다 (ECC 비활성화 상태)...")
-            init_success = erase_all_blocks_fast(nand)
+            touched_blocks = None
+            if erase_touched_only:
+                touched_blocks = {p >> nand.BLOCK_SHIFT for p in page_numbers if p is not None and p < total_pages}
+                print(f"\n사용 블록 {len(touched_blocks)}개 초기화를 시작합니다 (ECC 비활성화 상태)...")
+            else:
+                print("\n전체 블록 초기화를 시작합니다 (ECC 비활성화 상태)...")
+            init_success = erase_all_blocks_fast(nand, touched_blocks)
             if not init_success:
                 print("경고: 일부 블록 초기화에 실패했지만 프로그래밍을 계속합니다.")
             else:
-                print("전체 블록 초기화가 성공적으로 완료되었습니다.")
-        
-        splits_dir = "output_splits"
-        validate_directory(splits_dir)
-        
-        files = [f for f in os.listdir(splits_dir) if f.endswith('.bin')]
-        if not files:
-            raise ValueError(f"프로그래밍할 파일이 없음: {splits_dir}")
-        files.sort()
-        
-        total_files = len(files)
-        failed_files_info = []
+                print("블록 초기화가 성공적으로 완료되었습니다.")
+
+        # 초기화(삭제) 단계에서 확정된 Bad Block에 속한 파일을 미리 골라 둔다
+        # (루프에서 쓰기 재시도로 시간을 쓰지 않고 바로 실패로 기록)
+        bad_blocks = frozenset(nand.bad_blocks)
+        bad_block_files = {index for index, p in enumerate(page_numbers)
+                           if p is not None and p >> nand.BLOCK_SHIFT in bad_blocks}
         
         MAX_RETRIES = 5
         
@@ -281,32 +600,53 @@ def program_nand(initialize_blocks: bool = False):
         total_pages_to_process = 0
         successful_pages_count = 0
 
+        # 진행률은 PROGRESS_INTERVAL초마다 한 줄만 갱신 (매 파일 tty write/flush 방지)
+        # 개별 실패 내역은 failed_files_info에 모아 두고 진행률 줄에는 실패 개수만 표시
+        last_report = 0.0
+
+        # 쓰기는 IO_DEPTH 페이지씩 모아 연속으로 수행하고 검증은 배치 단위로 수행
+        batch = []
+
         # 파일을 하나씩 처리
-        for file_index, filename in enumerate(files):
-            # 진행률 계산 및 표시
-            progress_percent = (file_index / total_files) * 100
-            
-            sys.stdout.write(f"\r[{progress_percent:5.1f}%] 파일 {file_index + 1}/{total_files}: {filename[:30]}...")
-            sys.stdout.flush()
+        for file_index, (filename, file_data) in enumerate(zip(names, page_sources)):
+            # 진행률 계산 및 표시 (시계 확인도 배치 경계에서만)
+            if file_index % IO_DEPTH == 0 and (now := time.perf_counter()) - last_report >= PROGRESS_INTERVAL:
+                last_report = now
+                progress_percent = (file_index / total_files) * 100
+                print(f"\r[{progress_percent:5.1f}%] 파일 {file_index + 1}/{total_files} (실패 {len(failed_files_info)}): {filename[:30]}...", end='', flush=True)
             
             try:
-                filepath = os.path.join(splits_dir, filename)
-                
-                if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
+                # 파일 내용은 prefetch_files 스레드가 이미 읽어 두었음
+                if isinstance(file_data, Exception):
+                    raise file_data
+                if not file_data:
                     print(f"\n경고: 파일이 없거나 비어있어 건너뜁니다: {filename}")
                     continue
 
-                with open(filepath, 'rb') as f:
-                    file_data = f.read()
-
-                start_address = hex_to_int(filename.split('.')[0])
-                page_no = start_address // FULL_PAGE_SIZE
+                page_no = page_numbers[file_index]
+                if page_no is None:
+                    raise ValueError(f"잘못된 16진수 문자열: {filename[:-4]}")
 
                 total_pages_to_process += 1
 
+                if file_index in out_of_range:
+                    failed_files_info.append({'file': filename, 'reason': f"장치 범위를 벗어난 페이지 번호: {page_no} (최대 {total_pages - 1})"})
+                    continue
+
+                if file_index in bad_block_files:
+                    failed_files_info.append({'file': filename, 'reason': f"Bad Block({page_no >> nand.BLOCK_SHIFT})이라 쓰기 건너뜀"})
+                    continue
+
                 # 3. 페이지 번호에 따라 ECC 상태를 동적으로 변경
                 is_block_0 = (page_no < nand.PAGES_PER_BLOCK)
 
+                # ECC 상태를 바꾸기 전에 현재 상태로 쓴 배치를 먼저 마무리
+                if batch and is_block_0 != ecc_state_enabled:
+                    ok_count, failures = program_and_verify_batch(nand, batch, not ecc_state_enabled, MAX_RETRIES, verify, skip_matching)
+                    successful_pages_count += ok_count
+                    failed_files_info.extend(failures)
+                    batch = []
+
                 # Block 0을 써야 하는데 ECC가 꺼져있다면 활성화
                 if is_block_0 and not ecc_state_enabled:
                     print(f"\n  [INFO] Block 0 작업을 위해 ECC 활성화 중 (페이지: {page_no})")
@@ -325,35 +665,23 @@ def program_nand(initialize_blocks: bool = False):
                 
                 # --- 👆 여기까지 수정 ---
 
-                # 페이지 쓰기
-                write_success = False
-                try:
-                    if program_page_only(nand, page_no, file_data, MAX_RETRIES):
-                        write_success = True
-                except Exception as e:
-                    failed_files_info.append({'file': filename, 'reason': str(e)})
-                    print(f"\n    쓰기 실패: Page {page_no} - {e}")
-
-                # 검증 단계
-                if write_success:
-                    page_info = {
-                        'filename': filename,
-                        'page_no': page_no,
-                        'data': file_data
-                    }
-                    verification_results = verify_pages_batch(nand, [page_info], MAX_RETRIES)
-                    
-                    if verification_results['success']:
-                        successful_pages_count += 1
-                    else:
-                        failed_info = verification_results['failed'][0]
-                        failed_files_info.append({'file': filename, 'reason': failed_info['error']})
-                        print(f"\n    검증 실패: Page {page_no} - {failed_info['error']}")
+                # 배치에 쌓고 IO_DEPTH가 차면 쓰기 후 검증 (내장 ECC가 켜진 Block 0은 캐시 쓰기 제외)
+                batch.append({'filename': filename, 'page_no': page_no, 'data': file_data})
+                if len(batch) >= IO_DEPTH:
+                    ok_count, failures = program_and_verify_batch(nand, batch, not ecc_state_enabled, MAX_RETRIES, verify, skip_matching)
+                    successful_pages_count += ok_count
+                    failed_files_info.extend(failures)
+                    batch = []
                         
             except Exception as e:
                 failed_files_info.append({'file': filename, 'reason': f"파일 처리 중 오류: {e}"})
-                print(f"\n  파일 처리 실패: {filename} - {e}")
         
+        # 남은 배치 처리
+        if batch:
+            ok_count, failures = program_and_verify_batch(nand, batch, not ecc_state_enabled, MAX_RETRIES, verify, skip_matching)
+            successful_pages_count += ok_count
+            failed_files_info.extend(failures)
+
         # 최종 진행률 100% 표시
         print(f"\r[100.0%] 모든 파일 처리 완료! ({total_files}/{total_files})")
         print("")
@@ -372,10 +700,12 @@ def program_nand(initialize_blocks: bool = False):
         print(f"실패: {failed_pages_count}")
         
         if failed_files_info:
+            print("\n실패 파일 (최대 10개):")
+            for info in failed_files_info[:10]:
+                print(f"  - {info['file']}: {info['reason'].splitlines()[0]}")
             print(f"\n실패 내역은 {error_log_filename} 파일을 확인하세요.")
             with open(error_log_filename, 'w', encoding='utf-8') as f:
-                for info in failed_files_info:
-                    f.write(f"File: {info['file']}, Reason: {info['reason']}\n")
+                f.write(''.join(f"File: {info['file']}, Reason: {info['reason']}\n" for info in failed_files_info))
                 
         return len(failed_files_info) == 0
             
@@ -383,11 +713,33 @@ def program_nand(initialize_blocks: bool = False):
         print(f"\n치명적 오류 발생: {str(e)}")
         return False
     finally:
-        if 'nand' in locals() and nand:
+        if prefetch is not None:
+            prefetch.close()  # 중간에 중단되었어도 읽기 스레드를 멈추고 join
+        if realtime:
+            restore_scheduling()  # 호출자 스레드가 FIFO/CPU 고정 상태로 남지 않도록
+        if image is not None:
+            image.close()
+        if owns_nand and nand:
             print("\nGPIO 리소스를 정리합니다.")
             del nand
 
 
 if __name__ == "__main__":
-    success = program_nand(initialize_blocks=True)
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="output_splits(또는 원본 이미지)를 NAND 플래시에 프로그래밍합니다.")
+    parser.add_argument('image', nargs='?', default=None,
+                        help="원본 이미지 경로 (주면 output_splits 대신 이미지를 mmap하여 직접 사용)")
+    # --skip-matching은 삭제를 하지 않으므로 삭제 범위를 정하는 --erase-touched와 함께 쓸 수 없음
+    erase_mode = parser.add_mutually_exclusive_group()
+    erase_mode.add_argument('--skip-matching', action='store_true',
+                            help="전체 삭제 없이 이미 같은 데이터가 들어 있는 페이지는 건너뛰고 지워진(0xFF) 페이지에만 씀. "
+                                 "다른 데이터가 남아 있는 페이지는 쓰지 않고 '블록 삭제 필요'로 실패 처리함 "
+                                 "(해당 블록은 --erase-touched 등으로 삭제 후 다시 실행)")
+    erase_mode.add_argument('--erase-touched', action='store_true',
+                            help="전체 삭제 대신 쓸 페이지가 있는 블록만 삭제 (나머지 블록은 기존 내용 유지)")
+    parser.add_argument('--no-verify', action='store_true',
+                        help="쓰기 후 읽기 검증을 생략하고 프로그램 상태만 확인")
+    args = parser.parse_args()
+    success = program_nand(initialize_blocks=not args.skip_matching, image_path=args.image,
+                           verify=not args.no_verify, skip_matching=args.skip_matching,
+                           erase_touched_only=args.erase_touched)
+    sys.exit(0 if success else 1)
@@ -1,8 +1,20 @@
+import functools
+import re
 import sys
 import time
 from datetime import datetime
 from nand_driver import MT29F4G08ADADA
 
+NON_FF_BYTE = re.compile(rb'[^\xff]')  # 지워지지 않은(0xFF가 아닌) 바이트 하나
+
+def first_non_ff(data: bytes) -> int:
+    """data에서 0xFF가 아닌 첫 바이트의 오프셋을 반환합니다. 전부 0xFF이면 -1을 반환합니다.
+
+    바이트 단위 Python 루프 대신 bytes.lstrip(C 구현) 한 번으로 선두의 0xFF 구간을 건너뜁니다.
+    """
+    rest = data.lstrip(b'\xff')
+    return len(data) - len(rest) if rest else -1
+
 def verify_block(nand, block_no: int, pages_to_check: list = None) -> dict:
     """단일 블록 검증
     
@@ -18,6 +30,8 @@ def verify_block(nand, block_no: int, pages_to_check: list = None) -> dict:
     block_start_page = block_no * PAGES_PER_BLOCK
     MAX_RETRIES = 5  # 페이지 읽기 최대 재시도 횟수
     TIMEOUT_SECONDS = 5  # 각 시도당 최대 대기 시간
+    RETRY_DELAY_MIN = 50e-6  # 읽기 재시도 첫 대기 (50us)
+    RETRY_DELAY_MAX = 2e-3  # 읽기 재시도 최대 대기 (2ms)
     
     # 공장 출하 시 Bad Block 마킹 확인
     first_page = block_start_page
@@ -49,8 +63,9 @@ def verify_block(nand, block_no: int, pages_to_check: list = None) -> dict:
         # 페이지 읽기 재시도 로직
         read_success = False
         for retry in range(MAX_RETRIES):
-            timeout_start = time.time()
+            timeout_start = time.monotonic_ns()  # NTP 보정 등 시각 변경 영향 없는 정수 ns 시계
             timeout_occurred = False
+            delay = RETRY_DELAY_MIN
             
             while True:
                 try:
@@ -58,10 +73,12 @@ def verify_block(nand, block_no: int, pages_to_check: list = None) -> dict:
                     read_success = True
                     break
                 except Exception as e:
-                    if time.time() - timeout_start > TIMEOUT_SECONDS:
+                    if time.monotonic_ns() - timeout_start > TIMEOUT_SECONDS * 1_000_000_000:
                         timeout_occurred = True
                         break
-                    time.sleep(0.1)
+                    # 일시적 오류는 tR(수십 us) 안에 풀리므로 짧게 시작해 2배씩 늘림
+                    time.sleep(delay)
+                    delay = min(delay * 2, RETRY_DELAY_MAX)
             
             if read_success:
                 break
@@ -78,17 +95,15 @@ def verify_block(nand, block_no: int, pages_to_check: list = None) -> dict:
         if not read_success:
             continue
         
-        # FF 값 검증
-        if not all(b == 0xFF for b in data):
+        # FF 값 검증 (바이트 단위 generator 대신 C 구현 lstrip 한 번)
+        offset = first_non_ff(data)
+        if offset >= 0:
             # 오류가 있는 경우 첫 번째 오류 위치와 값 기록
-            for offset, value in enumerate(data):
-                if value != 0xFF:
-                    errors.append({
-                        'page': page_no,
-                        'offset': offset,
-                        'value': value
-                    })
-                    break  # 첫 번째 오류만 기록
+            errors.append({
+                'page': page_no,
+                'offset': offset,
+                'value': data[offset]
+            })
     
     return {
         'success': len(errors) == 0,
@@ -133,14 +148,17 @@ def verify_block_initialization(nand, block_no: int, verification_level: str = "
         elif verification_level == "sample":
             # 샘플링 방식: 여러 페이지의 여러 위치 확인
             sample_pages = [0, 15, 31, 47, 63]  # 5개 페이지
-            sample_offsets = [0, 512, 1024, 1536, 2047]  # 각 페이지당 5개 위치
+            # 각 페이지당 5개 위치. 앞쪽 256바이트 안에서 고르면 페이지 전체(2048바이트) 대신
+            # 256바이트만 전송하면 되므로 페이지당 버스 전송량이 1/8로 줄어든다.
+            sample_offsets = [0, 64, 128, 192, 255]
+            sample_read_len = sample_offsets[-1] + 1
             
             errors = []
             total_checked = 0
             
             for page_offset in sample_pages:
                 page_no = block_start_page + page_offset
-                page_data = nand.read_page(page_no, PAGE_SIZE)
+                page_data = nand.read_page(page_no, sample_read_len)
                 
                 for offset in sample_offsets:
                     if offset < len(page_data):
@@ -171,26 +189,33 @@ def verify_block_initialization(nand, block_no: int, verification_level: str = "
             for page_offset in range(PAGES_PER_BLOCK):
                 page_no = block_start_page + page_offset
                 page_data = nand.read_page(page_no, PAGE_SIZE)
-                
-                for offset, byte_value in enumerate(page_data):
-                    total_checked += 1
+
+                # 지워진 페이지(전부 0xFF)는 바이트 루프 없이 통과
+                first_bad = first_non_ff(page_data)
+                if first_bad < 0:
+                    total_checked += len(page_data)
+                    continue
+
+                # 0xFF가 아닌 바이트만 정규식 엔진(C 구현)으로 건너뛰며 찾음
+                for match in NON_FF_BYTE.finditer(page_data, first_bad):
+                    offset = match.start()
+                    errors.append({
+                        'page': page_no,
+                        'offset': offset,
+                        'value': page_data[offset]
+                    })
                     
-                    if byte_value != 0xFF:
-                        errors.append({
-                            'page': page_no,
-                            'offset': offset,
-                            'value': byte_value
-                        })
-                        
-                        # 너무 많은 오류가 발견되면 조기 종료
-                        if len(errors) >= 100:
-                            return {
-                                'success': False,
-                                'level': 'full',
-                                'errors': errors[:10],  # 처음 10개만 반환
-                                'total_errors': f'{len(errors)}+ (조기 종료)',
-                                'coverage': f'{total_checked} bytes / 131072 bytes (조기 종료)'
-                            }
+                    # 너무 많은 오류가 발견되면 조기 종료
+                    if len(errors) >= 100:
+                        total_checked += offset + 1
+                        return {
+                            'success': False,
+                            'level': 'full',
+                            'errors': errors[:10],  # 처음 10개만 반환
+                            'total_errors': f'{len(errors)}+ (조기 종료)',
+                            'coverage': f'{total_checked} bytes / 131072 bytes (조기 종료)'
+                        }
+                total_checked += len(page_data)
             
             if errors:
                 return {
@@ -221,7 +246,8 @@ def verify_block_initialization(nand, block_no: int, verification_level: str = "
             'error': f'검증 중 오류: {str(e)}'
         }
 
-def get_two_plane_pairs(total_blocks: int) -> list:
+@functools.lru_cache(maxsize=4)
+def get_two_plane_pairs(total_blocks: int) -> tuple:
     """전체 블록에서 Two-plane 삭제 가능한 블록 쌍을 생성합니다.
     
     Two-plane 조건:
@@ -232,52 +258,14 @@ def get_two_plane_pairs(total_blocks: int) -> list:
         total_blocks: 전체 블록 수
         
     Returns:
-        [(block1, block2), ...] 형태의 블록 쌍 리스트와 남은 단일 블록 리스트
+        ((block1, block2), ...) 형태의 블록 쌍 튜플과 남은 단일 블록 튜플.
+        결과는 total_blocks별로 캐시되므로 메뉴에서 삭제를 반복해도 한 번만 계산됩니다.
     """
-    pairs = []
-    remaining_blocks = []
-    
-    # 플레인별로 블록을 분류 (BA[6] 비트 기준)
-    plane0_blocks = []  # BA[6] = 0
-    plane1_blocks = []  # BA[6] = 1
-    
-    for block in range(total_blocks):
-        if (block >> 6) & 1 == 0:  # BA[6] = 0
-            plane0_blocks.append(block)
-        else:  # BA[6] = 1
-            plane1_blocks.append(block)
-    
-    # 각 플레인에서 동일한 인덱스의 블록들을 쌍으로 만들기
-    min_plane_size = min(len(plane0_blocks), len(plane1_blocks))
-    
-    for i in range(min_plane_size):
-        pairs.append((plane0_blocks[i], plane1_blocks[i]))
-    
-    # 남은 블록들은 단일 블록으로 처리
-    if len(plane0_blocks) > min_plane_size:
-        remaining_blocks.extend(plane0_blocks[min_plane_size:])
-    if len(plane1_blocks) > min_plane_size:
-        remaining_blocks.extend(plane1_blocks[min_plane_size:])
-    
-    return pairs, remaining_blocks
+    return MT29F4G08ADADA.two_plane_pairs(range(total_blocks))
 
-def get_two_plane_pairs_from_list(block_list: list) -> (list, list):
-    """주어진 블록 리스트에서 Two-plane 동작이 가능한 블록 쌍을 생성합니다."""
-    pairs = []
-    
-    # 플레인별로 블록을 분류
-    plane0_blocks = sorted([b for b in block_list if (b >> 6) & 1 == 0])
-    plane1_blocks = sorted([b for b in block_list if (b >> 6) & 1 == 1])
-    
-    # 각 플레인에서 동일한 인덱스의 블록들을 쌍으로 만들기
-    min_len = min(len(plane0_blocks), len(plane1_blocks))
-    for i in range(min_len):
-        pairs.append((plane0_blocks[i], plane1_blocks[i]))
-        
-    # 남은 블록들은 단일 블록으로 처리
-    remaining_blocks = plane0_blocks[min_len:] + plane1_blocks[min_len:]
-    
-    return pairs, remaining_blocks
+def get_two_plane_pairs_from_list(block_list: list) -> tuple:
+    """주어진 블록 리스트에서 Two-plane 동작이 가능한 블록 쌍과 남은 단일 블록을 생성합니다."""
+    return MT29F4G08ADADA.two_plane_pairs(block_list)
 
 def scan_bad_blocks_after_erase(nand: MT29F4G08ADADA):
     """삭제 후 Bad Block 스캔 (모든 블록에서 ECC 활성화)"""
@@ -316,7 +304,7 @@ def scan_bad_blocks_after_erase(nand: MT29F4G08ADADA):
                         first_byte = 0x00
                         last_byte = 0x00
                     else:
-                        time.sleep(0.01)
+                        time.sleep(50e-6 * 2 ** retry)  # 50us, 100us, ... 2배씩 증가
             
             # 첫 바이트가 0xFF가 아니면 Bad Block
             if first_byte != 0xFF or last_byte != 0xFF:
@@ -389,30 +377,47 @@ def erase_and_verify_blocks_two_plane(nand: MT29F4G08ADADA, verification_level:
         block_pairs, remaining_blocks = get_two_plane_pairs(TOTAL_BLOCKS)
         
         # 1-1: Two-plane으로 블록 쌍 삭제
+        # 진행률은 약 1% 단위로만 출력 (매 반복 tty write/flush 방지)
+        progress_step = max(10, len(block_pairs) // 100)
         for pair_idx, (block1, block2) in enumerate(block_pairs):
-            sys.stdout.write(f"\rTwo-plane 삭제 진행: {(pair_idx + 1) / len(block_pairs) * 100:.1f}%")
-            sys.stdout.flush()
+            if pair_idx % progress_step == 0 or pair_idx == len(block_pairs) - 1:
+                sys.stdout.write(f"\rTwo-plane 삭제 진행: {(pair_idx + 1) / len(block_pairs) * 100:.1f}%")
+                sys.stdout.flush()
             page1, page2 = block1 * PAGES_PER_BLOCK, block2 * PAGES_PER_BLOCK
             try:
-                nand.erase_block_two_plane(page1, page2)
-                successful_blocks_erase.extend([block1, block2])
+                status = nand.erase_block_two_plane(page1, page2, raise_on_fail=False)
             except Exception:
+                status = 0x01
+            # 삭제 직후 읽은 상태 레지스터의 FAIL 비트가 깨끗한 블록만 검증 대상에 넣는다
+            if status & 0x01 == 0:
+                successful_blocks_erase.extend([block1, block2])
+            else:
                 for b, p in [(block1, page1), (block2, page2)]:
                     try:
-                        nand.erase_block(p)
-                        successful_blocks_erase.append(b)
+                        status = nand.erase_block(p, raise_on_fail=False)
                     except Exception as e:
                         failed_blocks_erase.append(b)
                         print(f"\n블록 {b} 단일 삭제 실패: {e}")
+                        continue
+                    if status & 0x01 == 0:
+                        successful_blocks_erase.append(b)
+                    else:
+                        failed_blocks_erase.append(b)
+                        print(f"\n블록 {b} 단일 삭제 상태 FAIL (0x{status:02X})")
 
         # 1-2: 남은 단일 블록 삭제
         for block in remaining_blocks:
             try:
-                nand.erase_block(block * PAGES_PER_BLOCK)
-                successful_blocks_erase.append(block)
+                status = nand.erase_block(block * PAGES_PER_BLOCK, raise_on_fail=False)
             except Exception as e:
                 failed_blocks_erase.append(block)
                 print(f"\n단일 블록 {block} 삭제 실패: {e}")
+                continue
+            if status & 0x01 == 0:
+                successful_blocks_erase.append(block)
+            else:
+                failed_blocks_erase.append(block)
+                print(f"\n단일 블록 {block} 삭제 상태 FAIL (0x{status:02X})")
 
         erase_end_time = datetime.now()
         print("\n\n1단계 (삭제) 완료. 소요 시간:", erase_end_time - start_datetime)
@@ -435,18 +440,20 @@ def erase_and_verify_blocks_two_plane(nand: MT29F4G08ADADA, verification_level:
         if verification_level == "full":
             verify_pairs, verify_singles = get_two_plane_pairs_from_list(successful_blocks_erase)
             
+            progress_step = max(10, len(verify_pairs) // 100)
             for i, (block1, block2) in enumerate(verify_pairs):
-                sys.stdout.write(f"\rTwo-plane 검증 진행: {(i + 1) / len(verify_pairs) * 100:.1f}%")
-                sys.stdout.flush()
+                if i % progress_step == 0 or i == len(verify_pairs) - 1:
+                    sys.stdout.write(f"\rTwo-plane 검증 진행: {(i + 1) / len(verify_pairs) * 100:.1f}%")
+                    sys.stdout.flush()
                 
                 for page_offset in range(PAGES_PER_BLOCK):
                     page1 = block1 * PAGES_PER_BLOCK + page_offset
                     page2 = block2 * PAGES_PER_BLOCK + page_offset
                     d1, d2 = nand.read_page_two_plane(page1, page2, PAGE_SIZE)
-                    if not all(b == 0xFF for b in d1):
+                    if first_non_ff(d1) >= 0:
                         data_corruption_blocks.append(block1)
                         break
-                    if not all(b == 0xFF for b in d2):
+                    if first_non_ff(d2) >= 0:
                         data_corruption_blocks.append(block2)
                         break
             
@@ -454,9 +461,11 @@ def erase_and_verify_blocks_two_plane(nand: MT29F4G08ADADA, verification_level:
                 res = verify_block_initialization(nand, block, "full")
                 if not res['success']: data_corruption_blocks.append(block)
         else:
+            progress_step = max(10, len(successful_blocks_erase) // 100)
             for i, block in enumerate(successful_blocks_erase):
-                sys.stdout.write(f"\r단일 블록 검증 진행: {(i + 1) / len(successful_blocks_erase) * 100:.1f}%")
-                sys.stdout.flush()
+                if i % progress_step == 0 or i == len(successful_blocks_erase) - 1:
+                    sys.stdout.write(f"\r단일 블록 검증 진행: {(i + 1) / len(successful_blocks_erase) * 100:.1f}%")
+                    sys.stdout.flush()
                 res = verify_block_initialization(nand, block, verification_level)
                 if not res['success']: data_corruption_blocks.append(block)
         
@@ -502,8 +511,10 @@ def erase_and_verify_blocks_two_plane(nand: MT29F4G08ADADA, verification_level:
             f.write(f"검증 수준: {verification_level}\n")
             f.write(f"총 Bad Block: {total_bad_blocks}개\n")
             f.write("=== Bad Block 목록 ===\n")
-            for block in sorted(list(nand.bad_blocks)):
-                reason = "삭제 실패" if block in failed_blocks_erase else "초기화 실패"
+            # 리스트 대신 집합으로 멤버십 확인 (Bad Block 수 × 삭제 실패 수 스캔 방지)
+            failed_erase_set = set(failed_blocks_erase)
+            for block in sorted(nand.bad_blocks):
+                reason = "삭제 실패" if block in failed_erase_set else "초기화 실패"
                 f.write(f"  블록 {block}: {reason}\n")
         
         print(f"\n상세 로그가 {log_filename} 파일에 저장되었습니다.")